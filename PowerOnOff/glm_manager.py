@@ -126,6 +126,7 @@ class GlmManager:
         self._hwnd: int = 0  # Cached window handle
         self._running = False
         self._watchdog_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()  # Wakes the watchdog sleep on stop()
         self._non_responsive_count = 0
         self._lock = threading.Lock()
 
@@ -171,6 +172,7 @@ class GlmManager:
 
         # Start watchdog thread
         self._running = True
+        self._stop_event.clear()
         self._watchdog_thread = threading.Thread(
             target=self._watchdog_loop,
             name="GLMWatchdog",
@@ -192,6 +194,7 @@ class GlmManager:
         """
         logger.info("GlmManager stopping...")
         self._running = False
+        self._stop_event.set()
 
         if self._watchdog_thread and self._watchdog_thread.is_alive():
             self._watchdog_thread.join(timeout=10)
@@ -401,19 +404,14 @@ class GlmManager:
             return 0
 
         try:
-            # Find JUCE windows (same as glm_power.py)
-            wins = Desktop(backend="win32").windows(class_name_re=r"JUCE_.*")
-
-            # Filter for windows with "GLM" in title
-            candidates = [w for w in wins if "GLM" in (w.window_text() or "")]
-
-            # Filter by PID
-            for w in candidates:
+            # Find JUCE windows (same as glm_power.py), filtering by title
+            # and PID in a single pass
+            for w in Desktop(backend="win32").windows(class_name_re=r"JUCE_.*"):
                 try:
-                    if w.process_id() == pid:
+                    title = w.window_text() or ""
+                    if "GLM" in title and w.process_id() == pid:
                         hwnd = w.handle
-                        title = w.window_text() or "(no title)"
-                        logger.debug(f"Found GLM window: Handle={hwnd} Title='{title}'")
+                        logger.debug("Found GLM window: Handle=%s Title='%s'", hwnd, title)
                         return hwnd
                 except Exception:
                     pass
@@ -475,7 +473,7 @@ class GlmManager:
         if not self._process:
             return 0
 
-        deadline = time.time() + self.config.enforce_max_seconds
+        deadline = time.monotonic() + self.config.enforce_max_seconds
         last_handle = 0
         stable_count = 0
 
@@ -484,7 +482,7 @@ class GlmManager:
             f"poll every {self.config.enforce_poll_interval}s, for up to {self.config.enforce_max_seconds}s."
         )
 
-        while time.time() < deadline:
+        while time.monotonic() < deadline:
             try:
                 if not self._process.is_running():
                     logger.warning(f"{self.config.process_name} exited during stabilization.")
@@ -493,13 +491,13 @@ class GlmManager:
                 hwnd = self._get_main_window_handle(self._process.pid)
 
                 if hwnd == 0:
-                    logger.debug(f"GLM main window not found yet (PID={self._process.pid}) - waiting for 'GLM' title")
+                    logger.debug("GLM main window not found yet (PID=%s) - waiting for 'GLM' title", self._process.pid)
                     last_handle = 0
                     stable_count = 0
                     time.sleep(self.config.enforce_poll_interval)
                     continue
 
-                logger.debug(f"Found GLM main window: PID={self._process.pid} Handle={hwnd}")
+                logger.debug("Found GLM main window: PID=%s Handle=%s", self._process.pid, hwnd)
 
                 # Track handle stability
                 if hwnd == last_handle:
@@ -507,9 +505,9 @@ class GlmManager:
                 else:
                     last_handle = hwnd
                     stable_count = 1
-                    logger.debug(f"New window handle detected. Resetting counters. Handle={hwnd}")
+                    logger.debug("New window handle detected. Resetting counters. Handle=%s", hwnd)
 
-                logger.debug(f"StableCount={stable_count} Handle={hwnd}")
+                logger.debug("StableCount=%d Handle=%s", stable_count, hwnd)
 
                 # Check if stable enough
                 if stable_count >= self.config.stable_handle_count:
@@ -624,7 +622,7 @@ class GlmManager:
             except Exception as e:
                 logger.error(f"Watchdog loop error: {e}")
 
-            time.sleep(self.config.watchdog_interval)
+            self._stop_event.wait(self.config.watchdog_interval)
 
         logger.info("Watchdog loop ended.")
 
@@ -474,40 +474,41 @@ class GlmPowerController:
         Raises:
             GlmWindowNotFoundError: If GLM window not found.
         """
-        now = time.time()
+        now = time.monotonic()
         if use_cache and self._window_cache is not None:
             if (now - self._window_cache_time) < self._window_cache_ttl:
-                # Verify window still exists
+                # Verify window still exists. IsWindow only consults the handle
+                # table, unlike window_text() which round-trips WM_GETTEXT to GLM.
                 try:
-                    self._window_cache.window_text()
-                    return self._window_cache
+                    if ctypes.windll.user32.IsWindow(self._window_cache.handle):
+                        return self._window_cache
                 except Exception:
-                    self._window_cache = None
-
-        # Find GLM window (JUCE app)
-        wins = Desktop(backend="win32").windows(class_name_re=r"JUCE_.*")
-        candidates = [w for w in wins if "GLM" in (w.window_text() or "")]
-
-        # Filter by PID if specified (avoids finding wrong window during startup)
-        if self._pid and candidates:
-            pid_filtered = []
-            for w in candidates:
+                    pass
+                self._window_cache = None
+
+        # Find GLM window (JUCE app). Single pass: only the first match is used,
+        # so stop at it instead of materialising candidate lists.
+        match = None
+        for w in Desktop(backend="win32").windows(class_name_re=r"JUCE_.*"):
+            if "GLM" not in (w.window_text() or ""):
+                continue
+            # Filter by PID if specified (avoids finding wrong window during startup).
+            # When PID is specified, ONLY accept PID matches (don't fall back).
+            if self._pid:
                 try:
-                    if w.process_id() == self._pid:
-                        pid_filtered.append(w)
+                    if w.process_id() != self._pid:
+                        continue
                 except Exception:
-                    pass  # Skip windows we can't query
-            # When PID is specified, ONLY use PID-filtered results (don't fall back)
-            candidates = pid_filtered
-            if candidates:
-                self.logger.debug(f"Filtered to {len(candidates)} window(s) by PID {self._pid}")
+                    continue  # Skip windows we can't query
+            match = w
+            break
 
-        if not candidates:
+        if match is None:
             raise GlmWindowNotFoundError(
                 "GLM window not found. Is GLM running and visible?"
             )
 
-        self._window_cache = candidates[0]
+        self._window_cache = match
         self._window_cache_time = now
         return self._window_cache
 
@@ -562,7 +563,7 @@ class GlmPowerController:
             r = win.rectangle()
             if r.left >= 0 and r.top >= 0 and r.right > r.left and r.bottom > r.top:
                 break  # Valid rectangle
-            self.logger.debug(f"Waiting for window restore (rect={r.left},{r.top},{r.right},{r.bottom})")
+            self.logger.debug("Waiting for window restore (rect=%d,%d,%d,%d)", r.left, r.top, r.right, r.bottom)
             time.sleep(0.1)
 
     def _capture_window_state(self, win) -> WindowState:
@@ -704,16 +705,15 @@ class GlmPowerController:
             gold_count = int(np.count_nonzero(gold_mask))
 
             if gold_count >= cfg.offline_gold_threshold:
-                self.logger.debug(
-                    f"OFFLINE scan: {gold_count} gold pixels -> OFF"
-                )
+                self.logger.debug("OFFLINE scan: %d gold pixels -> OFF", gold_count)
                 return "off", gold_count
             elif gold_count == 0:
                 self.logger.debug("OFFLINE scan: 0 gold pixels -> ON")
                 return "on", 0
             else:
                 self.logger.debug(
-                    f"OFFLINE scan: {gold_count} gold pixels (below threshold {cfg.offline_gold_threshold}) -> unknown"
+                    "OFFLINE scan: %d gold pixels (below threshold %d) -> unknown",
+                    gold_count, cfg.offline_gold_threshold,
                 )
                 return "unknown", gold_count
         except Exception as e:
@@ -824,7 +824,7 @@ class GlmPowerController:
             return offline_state, rgb, pt
 
         # OFFLINE scan inconclusive, use button pixel
-        self.logger.debug(f"OFFLINE scan inconclusive, using button pixel: {button_state}")
+        self.logger.debug("OFFLINE scan inconclusive, using button pixel: %s", button_state)
         return button_state, rgb, pt
 
     def _click_point(self, pt: Point) -> None:
@@ -843,19 +843,19 @@ class GlmPowerController:
     ) -> Tuple[PowerState, Tuple[int, int, int], Point]:
         """Poll until desired state or timeout."""
         timeout = timeout or self.config.verify_timeout
-        start_time = time.time()
+        start_time = time.monotonic()
         deadline = start_time + timeout
         last = ("unknown", (0, 0, 0), Point(0, 0))
 
-        while time.time() < deadline:
+        while time.monotonic() < deadline:
             last = self._read_state_internal(win)
             if last[0] == desired:
-                elapsed_ms = (time.time() - start_time) * 1000
-                self.logger.debug(f"Power state changed to {desired} after {elapsed_ms:.0f}ms polling")
+                elapsed_ms = (time.monotonic() - start_time) * 1000
+                self.logger.debug("Power state changed to %s after %.0fms polling", desired, elapsed_ms)
                 return last
             time.sleep(self.config.poll_interval)
 
-        elapsed_ms = (time.time() - start_time) * 1000
+        elapsed_ms = (time.monotonic() - start_time) * 1000
         self.logger.warning(f"Power state polling timed out after {elapsed_ms:.0f}ms (wanted {desired}, got {last[0]})")
         return last
 
@@ -891,7 +891,7 @@ class GlmPowerController:
                     self._ensure_foreground(win)
 
                 state, rgb, pt = self._read_state_internal(win)
-                self.logger.debug(f"Power state: {state} (rgb={rgb}, pt=({pt.x},{pt.y}))")
+                self.logger.debug("Power state: %s (rgb=%s, pt=(%d,%d))", state, rgb, pt.x, pt.y)
 
                 if state != "unknown":
                     self._last_known_state = state
@@ -967,7 +967,7 @@ class GlmPowerController:
             raise ValueError("desired must be 'on' or 'off'")
 
         with self._lock:
-            t0 = time.time()
+            t0 = time.monotonic()
             win = self._find_window(use_cache=False)  # Fresh lookup for state changes
 
             # Capture state before any focus changes
@@ -976,9 +976,9 @@ class GlmPowerController:
                 saved_state = self._capture_window_state(win)
 
             try:
-                t1 = time.time()
+                t1 = time.monotonic()
                 self._ensure_foreground(win)
-                t2 = time.time()
+                t2 = time.monotonic()
 
                 # Read current state with retry on "unknown"
                 # Transient occlusions (dialogs, tooltips, render artifacts)
@@ -986,7 +986,7 @@ class GlmPowerController:
                 unknown_retries = 3
                 unknown_retry_delay = 0.5
                 state, rgb, pt = self._read_state_internal(win)
-                t3 = time.time()
+                t3 = time.monotonic()
                 self.logger.debug(
                     f"Power set_state({desired}): current={state}, rgb={rgb} "
                     f"[find={t1-t0:.3f}s, focus={t2-t1:.3f}s, read={t3-t2:.3f}s]"
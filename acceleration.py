@@ -16,6 +16,9 @@ class AccelerationHandler:
     The acceleration curve is configurable via volume_increases_list.
     """
 
+    __slots__ = ("min_click", "max_per_click_avg", "volume_increases_list", "len", "_max_index",
+                 "last_button", "last_time", "first_time", "distance", "count", "delta_time")
+
     def __init__(self, min_click: float, max_per_click_avg: float, volume_list: List[int]):
         """
         Initialize the acceleration handler.
@@ -27,8 +30,9 @@ class AccelerationHandler:
         """
         self.min_click = min_click
         self.max_per_click_avg = max_per_click_avg
-        self.volume_increases_list = volume_list
-        self.len = len(volume_list)  # Cache length (list is immutable)
+        self.volume_increases_list = tuple(int(v) for v in volume_list)  # Tuple: immutable, faster indexing
+        self.len = len(self.volume_increases_list)
+        self._max_index = self.len - 1
         self.last_button = 0
         self.last_time = 0
         self.first_time = 0
@@ -41,29 +45,30 @@ class AccelerationHandler:
         Calculate volume change based on click speed.
 
         Args:
-            current_time: Current timestamp
+            current_time: Current time.perf_counter() timestamp
             button: Button/direction identifier (to detect direction changes)
 
         Returns:
             Volume delta (how much to change volume by)
         """
-        self.delta_time = current_time - self.last_time
-        # Guard against division by zero (shouldn't happen with count initialized to 1)
-        if self.count > 0:
-            avg_step_time = (current_time - self.first_time) / self.count
-        else:
-            avg_step_time = float('inf')
-
-        if (self.last_button != button) or (avg_step_time > self.max_per_click_avg) or (self.delta_time > self.min_click):
-            self.distance = 1
+        # Called per HID volume event: work on locals, write state back once
+        delta_time = current_time - self.last_time
+        count = self.count
+        # count is always >= 1, so compare total elapsed time against
+        # max_per_click_avg * count instead of dividing for the average.
+        if ((self.last_button != button)
+                or (current_time - self.first_time > self.max_per_click_avg * count)
+                or (delta_time > self.min_click)):
+            distance = 1
             self.count = 1
             self.first_time = current_time
         else:
-            if self.count <= self.len:  # count 1..len maps to indices 0..len-1
-                self.distance = self.volume_increases_list[self.count - 1]
-            else:
-                self.distance = self.volume_increases_list[-1]
-            self.count += 1
+            # count 1..len maps to indices 0..len-1, then saturates at the last entry
+            max_index = self._max_index
+            distance = self.volume_increases_list[count - 1 if count <= max_index else max_index]
+            self.count = count + 1
+        self.delta_time = delta_time
+        self.distance = distance
         self.last_button = button
         self.last_time = current_time
-        return int(self.distance)
+        return distance
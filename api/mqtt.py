@@ -156,7 +156,7 @@ class MqttClient:
 
     def _submit_action(self, action, trace_id: str = ""):
         """Submit an action to the queue with trace ID."""
-        self._action_queue.put(QueuedAction(action=action, timestamp=time.time(), trace_id=trace_id))
+        self._action_queue.put(QueuedAction(action=action, timestamp=time.monotonic(), trace_id=trace_id))
 
     def _publish_state(self, state: dict):
         """Publish current state to MQTT."""
@@ -126,7 +126,7 @@ def create_app(action_queue, glm_controller, cors_origin: str = "*", version: st
     Create FastAPI app with references to the action queue and controller.
 
     Args:
-        action_queue: The queue.Queue for submitting GlmActions
+        action_queue: The ActionQueue for submitting GlmActions
         glm_controller: The GlmController instance for reading state
         cors_origin: CORS Allow-Origin header value (default: "*")
         version: Application version string (shown in health endpoint)
@@ -217,7 +217,7 @@ def _submit_action(action):
         logger.error("api.error: Action queue not initialized")
         return False, None, "not_initialized"
     tid = trace_ids.next("api")
-    _action_queue.put(QueuedAction(action=action, timestamp=time.time(), trace_id=tid))
+    _action_queue.put(QueuedAction(action=action, timestamp=time.monotonic(), trace_id=tid))
     return True, tid, None
 
 
@@ -436,7 +436,7 @@ def start_api_server(action_queue, glm_controller, host: str = "0.0.0.0", port:
     Start the API server in a background thread.
 
     Args:
-        action_queue: The queue.Queue for submitting GlmActions
+        action_queue: The ActionQueue for submitting GlmActions
         glm_controller: The GlmController instance
         host: Bind address (default: 0.0.0.0)
         port: Port number (default: 8080)
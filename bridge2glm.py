@@ -5,18 +5,21 @@ Bridges a Fosi Audio VOL20 USB volume knob to Genelec GLM software via MIDI.
 Supports volume control, mute, dim, and power management with UI automation.
 """
 
-__version__ = "0.12.4.4"
+__version__ = "0.12.4.107"
 
+import gc
 import time
 import signal
 import sys
 import os
 import threading
 import queue
-from typing import Dict, Optional, List, Callable
+from collections import deque
+from operator import attrgetter
+from typing import Dict, Optional, Callable, NamedTuple, Sequence, Tuple
 import hid
 
-from glm_core import SetVolume, AdjustVolume, SetMute, SetDim, SetPower, QueuedAction, trace_ids
+from glm_core import SetVolume, AdjustVolume, SetMute, SetDim, SetPower, QueuedAction, ActionQueue, trace_ids
 from mido import Message, open_output, open_input
 
 # Import from extracted modules
@@ -25,11 +28,11 @@ from retry_logger import retry_logger
 from midi_constants import (
     Action, ControlMode, GlmControl,
     GLM_VOLUME_ABS, GLM_VOL_UP_CC, GLM_VOL_DOWN_CC, GLM_MUTE_CC, GLM_DIM_CC, GLM_POWER_CC,
-    POWER_PATTERN, POWER_PATTERN_WINDOW, POWER_PATTERN_MIN_SPAN, POWER_STARTUP_WINDOW,
+    POWER_PATTERN_LEN, POWER_PATTERN_SET, POWER_PATTERN_FP, POWER_PATTERN_FP_MASK, POWER_PATTERN_WINDOW, POWER_PATTERN_MIN_SPAN, POWER_STARTUP_WINDOW,
     POWER_PATTERN_MAX_GAP, POWER_PATTERN_MAX_TOTAL, POWER_PATTERN_PRE_GAP,
     CC_NAMES, ACTION_TO_GLM, CC_TO_ACTION,
     KEY_VOL_UP, KEY_VOL_DOWN, KEY_CLICK, KEY_DOUBLE_CLICK, KEY_TRIPLE_CLICK, KEY_LONG_PRESS,
-    KEY_NAMES, DEFAULT_BINDINGS, log_midi as _log_midi
+    KEY_NAME_TABLE, DEFAULT_BINDINGS, keycode_table, log_midi as _log_midi
 )
 from acceleration import AccelerationHandler
 from logging_setup import setup_logging
@@ -51,14 +54,13 @@ except ImportError:
     GlmManager = None
     GlmManagerConfig = None
 
-import psutil
 import logging
 
 # Platform-specific imports (Windows thread priority)
 IS_WINDOWS = sys.platform == 'win32'
 if IS_WINDOWS:
+    import ctypes  # Standard library: needed for kernel32 calls even without pywin32
     try:
-        import ctypes
         import win32process
         HAS_WIN32 = True
         # Thread priority constants
@@ -72,15 +74,34 @@ if IS_WINDOWS:
         THREAD_PRIORITY_ABOVE_NORMAL = THREAD_PRIORITY_HIGHEST = 0
 else:
     HAS_WIN32 = False
-    THREAD_PRIORITY_IDLE = THREAD_PRIORITY_BELOW_NORMAL = 0
-    THREAD_PRIORITY_ABOVE_NORMAL = THREAD_PRIORITY_HIGHEST = 0
+    # Same values as the Win32 constants so levels stay distinct for the POSIX mapping
+    THREAD_PRIORITY_IDLE = -15
+    THREAD_PRIORITY_BELOW_NORMAL = -1
+    THREAD_PRIORITY_ABOVE_NORMAL = 1
+    THREAD_PRIORITY_HIGHEST = 2
+
+# Linux: thread priority level -> (SCHED_FIFO priority or None, fallback nice value).
+# Threads are schedulable tasks there, so both apply to the calling thread only.
+IS_LINUX = sys.platform.startswith("linux")
+_POSIX_THREAD_PRIORITY = {
+    THREAD_PRIORITY_HIGHEST: (10, -10),
+    THREAD_PRIORITY_ABOVE_NORMAL: (5, -5),
+    THREAD_PRIORITY_BELOW_NORMAL: (None, 5),
+    THREAD_PRIORITY_IDLE: (None, 19),
+}
 
 # Parameters
 MAX_EVENT_AGE = 2.0  # seconds
-SEND_DELAY = 0  # seconds for non-volume commands
+SEND_DELAY = 0  # Max seconds to wait for GLM to echo Mute/Dim before the next command (0 = don't wait)
 RETRY_DELAY = 5.0  # seconds
 HID_READ_TIMEOUT_MS = 1000  # milliseconds - balance between CPU usage and shutdown responsiveness
-QUEUE_MAX_SIZE = 100  # Maximum queued events before backpressure
+HID_READ_IDLE_TIMEOUT_MS = 5000  # milliseconds - read timeout once the knob has been idle a while
+HID_IDLE_READS = 30  # consecutive empty reads (~30s) before switching to the idle timeout
+HID_READ_SIZE = 64  # Full-speed max report size; hidapi returns one report per read, never truncated
+MAIN_WAIT_TIMEOUT = 3.0  # seconds - Windows main-thread poll (elsewhere it blocks until stopped)
+SHUTDOWN_JOIN_TIMEOUT = 2.0  # seconds - total wait for worker threads to exit on stop()
+MAX_COALESCE = 8  # Max extra queued volume actions merged into one send (bounds latency)
+STATE_NOTIFY_DEBOUNCE = 0.02  # seconds - unforced state notifications within this window are merged
 
 # Power control timing (UI automation based)
 POWER_SETTLING_TIME = 2.0   # Block ALL commands during power settling
@@ -101,37 +122,156 @@ def log_midi(direction: str, msg_type: str, cc: int = None, value: int = None, c
     _log_midi(logger, direction, msg_type, cc, value, channel, raw, trace_id=trace_id)
 
 
+# Prebuilt control_change messages keyed by (cc, value). Messages are only
+# ever sent, never mutated, so one shared instance per pair is thread-safe.
+_CC_MESSAGES: Dict[tuple, Message] = {}
+
+# CC 20 for every volume 0-127, built once at import: the volume path indexes
+# this directly instead of going through the (cc, value) dict.
+_VOLUME_MESSAGES: Tuple[Message, ...] = tuple(
+    Message('control_change', control=GLM_VOLUME_ABS, value=v) for v in range(128))
+
+
+def _cc_message(cc: int, value: int) -> Message:
+    """Return the shared control_change Message for cc/value (built on first use)."""
+    msg = _CC_MESSAGES.get((cc, value))
+    if msg is None:
+        msg = _CC_MESSAGES[(cc, value)] = Message('control_change', control=cc, value=value)
+    return msg
+
+
 # ==============================================================================
 # GLM STATE CONTROLLER - Tracks and controls GLM state
 # ==============================================================================
 
+class _GlmState(NamedTuple):
+    """Immutable snapshot of GLM state, published by a single attribute swap."""
+    volume: int                     # 0-127, confirmed from GLM via CC 20
+    pending_volume: Optional[int]   # What we've sent but GLM hasn't confirmed yet
+    mute: bool                      # from CC 23
+    dim: bool                       # from CC 24
+    power: bool                     # tracked locally (no MIDI feedback from GLM)
+    volume_initialized: bool        # True once we've received volume from GLM
+    settling_deadline: float        # time.monotonic() when power settling ends, 0 = never started
+    lockout_deadline: float         # time.monotonic() when the power cooldown ends, 0 = never started
+    power_settling: bool            # True during power settling period
+    power_target: Optional[bool]    # Target state during transition
+
+
+def _power_deadlines(now: float) -> dict:
+    """_GlmState fields for a power transition starting at now (time.monotonic)."""
+    return {
+        "settling_deadline": now + POWER_SETTLING_TIME,
+        "lockout_deadline": now + POWER_TOTAL_LOCKOUT,
+    }
+
+
+class _SendEntry(NamedTuple):
+    """Precomputed send_action dispatch for one Action."""
+    cc: int
+    current: Optional[Callable[[_GlmState], bool]]  # None for momentary controls
+
+
+# Toggle actions -> _GlmState field holding their current value
+_TOGGLE_FIELDS = {Action.MUTE: 'mute', Action.DIM: 'dim', Action.POWER: 'power'}
+
+_SEND_DISPATCH: Dict[Action, _SendEntry] = {
+    action: _SendEntry(
+        cc=ctrl.cc,
+        current=(attrgetter(_TOGGLE_FIELDS[action]) if ctrl.mode == ControlMode.TOGGLE else None),
+    )
+    for action, ctrl in ACTION_TO_GLM.items()
+}
+
+
 class GlmController:
-    """Tracks GLM state and provides smart control methods."""
+    """Tracks GLM state and provides smart control methods.
+
+    GLM state lives in an immutable _GlmState snapshot. Readers load
+    self._state once without locking (attribute assignment is atomic under
+    the GIL); writers serialize on self._lock, build a new snapshot with
+    _replace() and publish it with a single assignment.
+    """
+
+    __slots__ = ("_state", "_lock", "_state_callbacks", "_cb_lock", "_last_notified_state",
+                 "_notify_lock", "_notify_event", "_notify_forced", "_notify_deadline",
+                 "_notify_thread", "_notify_stopping", "_power_trace_id",
+                 "_last_sent_volume", "_ack_events")
 
     def __init__(self):
-        self.volume: int = 0       # 0-127, confirmed from GLM via CC 20
-        self._pending_volume: Optional[int] = None  # What we've sent but GLM hasn't confirmed yet
-        self.mute: bool = False    # from CC 23
-        self.dim: bool = False     # from CC 24
-        self.power: bool = True    # tracked locally (no MIDI feedback from GLM)
-        self._volume_initialized = False  # True once we've received volume from GLM
-        self._lock = threading.Lock()
-        self._state_callbacks: List[Callable[[dict], None]] = []
-        self._last_notified_state: Optional[dict] = None  # Debounce duplicate notifications
-        # Power transition state
-        self._power_transition_start: float = 0  # When power transition started
-        self._power_settling: bool = False       # True during power settling period
-        self._power_target: Optional[bool] = None  # Target state during transition
-        self._power_trace_id: str = ""           # Trace ID for current power transition
+        self._state = _GlmState(
+            volume=0, pending_volume=None, mute=False, dim=False,
+            power=True, volume_initialized=False,
+            settling_deadline=0, lockout_deadline=0, power_settling=False, power_target=None,
+        )
+        self._lock = threading.Lock()  # Serializes writers only
+        # Copy-on-write: add/remove swap in a new tuple, so notifiers iterate without a lock
+        self._state_callbacks: Tuple[Callable[[dict], None], ...] = ()
+        self._cb_lock = threading.Lock()  # Serializes callback add/remove (not state writers)
+        self._last_notified_state: Optional[_GlmState] = None  # Debounce duplicate notifications
+        # Callbacks run on one StateNotify thread, in order, so a slow MQTT/WebSocket
+        # subscriber never stalls the MIDI reader or consumer thread. Started on
+        # first use and stopped by stop_notifications().
+        self._notify_lock = threading.Lock()
+        self._notify_event = threading.Event()  # Wakes the StateNotify thread
+        self._notify_forced: deque = deque()  # Forced snapshots, dispatched without debounce
+        self._notify_deadline: Optional[float] = None  # When the pending debounced notify is due
+        self._notify_thread: Optional[threading.Thread] = None
+        self._notify_stopping = False
+        self._power_trace_id: str = ""  # Trace ID for current power transition
+        self._last_sent_volume: int = -1  # Last CC 20 value sent; -1 = unknown, always send
+        # Set when GLM echoes a toggle CC back; lets the consumer pace on the device, not a fixed sleep
+        self._ack_events: Dict[int, threading.Event] = {
+            GLM_MUTE_CC: threading.Event(),
+            GLM_DIM_CC: threading.Event(),
+        }
+
+    @property
+    def volume(self) -> int:
+        """Last volume confirmed by GLM (0-127)."""
+        return self._state.volume
+
+    @property
+    def mute(self) -> bool:
+        return self._state.mute
+
+    @property
+    def dim(self) -> bool:
+        return self._state.dim
+
+    @property
+    def power(self) -> bool:
+        return self._state.power
+
+    def set_power(self, power: bool, mark_transition: bool = False, notify: bool = False):
+        """
+        Publish a new power state.
+
+        Args:
+            power: New power state (True=ON).
+            mark_transition: Also stamp the power transition start, so the
+                cooldown/self-ACK window applies (used by RF follow-through).
+            notify: Notify state callbacks (after the lock is released).
+        """
+        with self._lock:
+            if mark_transition:
+                self._state = self._state._replace(power=power, **_power_deadlines(time.monotonic()))
+            else:
+                self._state = self._state._replace(power=power)
+            snapshot = self._state
+        if notify:
+            self._notify_state_change(snapshot)
 
     def add_state_callback(self, callback: Callable[[dict], None]):
         """Register a callback to be called when state changes."""
-        self._state_callbacks.append(callback)
+        with self._cb_lock:
+            self._state_callbacks = self._state_callbacks + (callback,)
 
     def remove_state_callback(self, callback: Callable[[dict], None]):
         """Unregister a state change callback."""
-        if callback in self._state_callbacks:
-            self._state_callbacks.remove(callback)
+        # Compared with == (not "is"): bound methods are new objects on each access
+        with self._cb_lock:
+            self._state_callbacks = tuple(cb for cb in self._state_callbacks if cb != callback)
 
     # =========================================================================
     # Power transition management
@@ -144,11 +284,12 @@ class GlmController:
         Called when power command is initiated. Blocks all commands during settling.
         """
         with self._lock:
-            self._power_transition_start = time.time()
-            self._power_settling = True
-            self._power_target = target_state
+            self._state = self._state._replace(
+                power_settling=True, power_target=target_state, **_power_deadlines(time.monotonic()),
+            )
             self._power_trace_id = trace_id
-        self._notify_state_change(force=True)  # Notify UI of transitioning state
+            snapshot = self._state
+        self._notify_state_change(snapshot, force=True)  # Notify UI of transitioning state
         prefix = f"[{trace_id}] " if trace_id else ""
         logger.info(f"{prefix}power.begin: target={'ON' if target_state else 'OFF'}")
 
@@ -159,30 +300,37 @@ class GlmController:
         Called when UI automation confirms state change (or fails).
         """
         with self._lock:
-            self._power_settling = False
-            duration = time.time() - self._power_transition_start if self._power_transition_start else 0
-            trace_id = getattr(self, '_power_trace_id', '')
+            s = self._state
+            duration = time.monotonic() - (s.settling_deadline - POWER_SETTLING_TIME) if s.settling_deadline else 0
+            trace_id = self._power_trace_id
+            power = s.power
             if success and actual_state is not None:
-                self.power = actual_state
-            elif success and self._power_target is not None:
-                self.power = self._power_target
-            self._power_target = None
-        self._notify_state_change(force=True)
+                power = actual_state
+            elif success and s.power_target is not None:
+                power = s.power_target
+            self._state = snapshot = s._replace(power=power, power_settling=False, power_target=None)
+        self._notify_state_change(snapshot, force=True)
         prefix = f"[{trace_id}] " if trace_id else ""
         result = "OK" if success else "FAILED"
-        logger.info(f"{prefix}power.end: {result}, power={'ON' if self.power else 'OFF'} (took {duration:.1f}s)")
+        logger.info(f"{prefix}power.end: {result}, power={'ON' if power else 'OFF'} (took {duration:.1f}s)")
 
     def is_power_settling(self) -> bool:
         """Check if power is currently settling (2s window)."""
+        s = self._state
+        if not s.power_settling:
+            return False
+        if time.monotonic() >= s.settling_deadline:
+            # Auto-end settling if timeout (shouldn't happen normally)
+            self._expire_power_settling(s)
+            return False
+        return True
+
+    def _expire_power_settling(self, seen: _GlmState):
+        """Clear power_settling once its window has passed, unless a new transition started."""
         with self._lock:
-            if not self._power_settling:
-                return False
-            elapsed = time.time() - self._power_transition_start
-            if elapsed >= POWER_SETTLING_TIME:
-                # Auto-end settling if timeout (shouldn't happen normally)
-                self._power_settling = False
-                return False
-            return True
+            s = self._state
+            if s.power_settling and s.settling_deadline == seen.settling_deadline:
+                self._state = s._replace(power_settling=False)
 
     def can_accept_command(self) -> tuple:
         """
@@ -191,18 +339,17 @@ class GlmController:
         Returns (allowed, wait_time, reason).
         During power settling, ALL commands are blocked.
         """
-        with self._lock:
-            if not self._power_settling:
-                return True, 0, None
+        s = self._state
+        if not s.power_settling:
+            return True, 0, None
 
-            elapsed = time.time() - self._power_transition_start
-            if elapsed < POWER_SETTLING_TIME:
-                wait = POWER_SETTLING_TIME - elapsed
-                return False, wait, "power_settling"
+        wait = s.settling_deadline - time.monotonic()
+        if wait > 0:
+            return False, wait, "power_settling"
 
-            # Settling done, commands allowed
-            self._power_settling = False
-            return True, 0, None
+        # Settling done, commands allowed
+        self._expire_power_settling(s)
+        return True, 0, None
 
     def can_accept_power_command(self) -> tuple:
         """
@@ -211,27 +358,93 @@ class GlmController:
         Returns (allowed, wait_time, reason).
         Power commands are blocked for POWER_TOTAL_LOCKOUT after a power transition.
         """
-        with self._lock:
-            if self._power_transition_start == 0:
-                return True, 0, None
-
-            elapsed = time.time() - self._power_transition_start
-            if elapsed < POWER_TOTAL_LOCKOUT:
-                wait = POWER_TOTAL_LOCKOUT - elapsed
-                if elapsed < POWER_SETTLING_TIME:
-                    return False, wait, "power_settling"
-                else:
-                    return False, wait, "power_cooldown"
-
+        s = self._state
+        now = time.monotonic()
+        if now >= s.lockout_deadline:
             return True, 0, None
 
-    def _notify_state_change(self, force: bool = False):
-        """Call all registered callbacks with current state (if changed or forced)."""
-        state = self.get_state()
-        # Debounce: only notify if state actually changed (unless forced)
-        if not force and state == self._last_notified_state:
+        wait = s.lockout_deadline - now
+        if now < s.settling_deadline:
+            return False, wait, "power_settling"
+        else:
+            return False, wait, "power_cooldown"
+
+    def _notify_state_change(self, snapshot: _GlmState, force: bool = False):
+        """
+        Call all registered callbacks with the given state (if changed or forced).
+
+        Must be called after releasing self._lock, with the snapshot the caller
+        published. Callbacks (MQTT publish, WebSocket broadcast) run on the
+        StateNotify thread, never on the caller's.
+
+        Forced notifications are dispatched as soon as the thread wakes.
+        Others are debounced: the first one in a burst (e.g. CC 20 while the
+        knob spins) sets a deadline STATE_NOTIFY_DEBOUNCE away, and callbacks
+        then see only the latest state.
+        """
+        if not self._state_callbacks:
+            return  # No subscribers: skip the thread hand-off entirely
+        if force:
+            self._notify_forced.append(snapshot)
+        else:
+            with self._notify_lock:
+                if self._notify_deadline is not None:
+                    return  # Already pending; it will pick up the latest snapshot
+                self._notify_deadline = time.monotonic() + STATE_NOTIFY_DEBOUNCE
+        if self._notify_thread is None:
+            self._start_notify_thread()
+        self._notify_event.set()
+
+    def _start_notify_thread(self):
+        """Start the StateNotify thread on first use (no-op once stopped)."""
+        with self._notify_lock:
+            if self._notify_thread is not None or self._notify_stopping:
+                return
+            self._notify_thread = threading.Thread(
+                target=self._notify_loop, daemon=True, name="StateNotify")
+            self._notify_thread.start()
+
+    def _notify_loop(self):
+        """StateNotify thread: dispatch forced snapshots, then due debounced ones."""
+        event = self._notify_event
+        forced = self._notify_forced
+        monotonic = time.monotonic
+        while True:
+            deadline = self._notify_deadline
+            event.wait(None if deadline is None else max(0.0, deadline - monotonic()))
+            # Clear before reading: a producer fills forced/deadline first, then sets
+            event.clear()
+            if self._notify_stopping:
+                return
+            while forced:
+                self._dispatch_state(forced.popleft(), True)
+            deadline = self._notify_deadline
+            if deadline is not None and monotonic() >= deadline:
+                with self._notify_lock:
+                    self._notify_deadline = None
+                self._dispatch_state(self._state)
+
+    def stop_notifications(self, timeout: float = 1.0):
+        """Stop the StateNotify thread (waits up to timeout for a running callback)."""
+        with self._notify_lock:
+            self._notify_stopping = True
+            thread = self._notify_thread
+        self._notify_event.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _dispatch_state(self, snapshot: _GlmState, force: bool = False):
+        """Invoke the state callbacks with the given snapshot (if changed or forced).
+
+        Runs only on the StateNotify thread, so callbacks are never concurrent.
+        """
+        # Debounce: only notify if state actually changed (unless forced).
+        # Snapshots are immutable tuples, so this is a C-level compare and
+        # the dict is only built when callbacks will actually run.
+        if not force and snapshot == self._last_notified_state:
             return
-        self._last_notified_state = state.copy()
+        self._last_notified_state = snapshot
+        state = self._state_dict(snapshot)
         for callback in self._state_callbacks:
             try:
                 callback(state)
@@ -241,8 +454,7 @@ class GlmController:
     @property
     def has_valid_volume(self) -> bool:
         """Check if we have received a valid volume reading from GLM."""
-        with self._lock:
-            return self._volume_initialized
+        return self._state.volume_initialized
 
     def get_effective_volume(self) -> int:
         """
@@ -251,29 +463,51 @@ class GlmController:
         Returns pending volume if we've sent a command that GLM hasn't confirmed yet,
         otherwise returns the last confirmed volume from GLM.
         """
-        with self._lock:
-            if self._pending_volume is not None:
-                return self._pending_volume
-            return self.volume
+        s = self._state
+        return s.pending_volume if s.pending_volume is not None else s.volume
 
     def get_volume_if_valid(self) -> Optional[int]:
         """
         Atomically check if volume is initialized and return effective volume.
 
         Returns effective volume (pending or confirmed) if initialized, None otherwise.
-        This combines has_valid_volume + get_effective_volume in a single lock acquisition.
+        This combines has_valid_volume + get_effective_volume in a single snapshot load.
+        """
+        s = self._state
+        if not s.volume_initialized:
+            return None
+        return s.pending_volume if s.pending_volume is not None else s.volume
+
+    def compute_and_pend_volume(self, delta: int) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Compute a relative volume target and mark it pending in one step.
+
+        Reading the effective volume and setting the pending value under the
+        same lock keeps a concurrent GLM volume report (update_from_midi) from
+        landing in between and being overwritten by a stale-based target.
+
+        Args:
+            delta: Volume change amount. Positive = up, negative = down.
+
+        Returns:
+            (current, target): (None, None) if volume isn't initialized yet;
+            target == current if already at the 0/127 limit (nothing pended).
         """
         with self._lock:
-            if not self._volume_initialized:
-                return None
-            if self._pending_volume is not None:
-                return self._pending_volume
-            return self.volume
+            s = self._state
+            if not s.volume_initialized:
+                return None, None
+            current = s.pending_volume if s.pending_volume is not None else s.volume
+            target = current + delta
+            target = 0 if target < 0 else 127 if target > 127 else target
+            if target != current:
+                self._state = s._replace(pending_volume=target)
+            return current, target
 
     def set_pending_volume(self, target: int):
         """Set the pending volume after sending a command."""
         with self._lock:
-            self._pending_volume = target
+            self._state = self._state._replace(pending_volume=target)
 
     def toggle_power_from_midi_pattern(self) -> bool:
         """Toggle power state when RF remote MIDI pattern is detected.
@@ -285,89 +519,146 @@ class GlmController:
             The new power state (True=ON, False=OFF).
         """
         with self._lock:
-            self.power = not self.power
-            new_power = self.power
-        self._notify_state_change()
+            new_power = not self._state.power
+            self._state = snapshot = self._state._replace(power=new_power)
+        self._notify_state_change(snapshot)
         return new_power
 
     def update_from_midi(self, cc: int, value: int) -> bool:
         """Update state from MIDI message. Returns True if state changed."""
+        return self.update_from_midi_batch(((cc, value),))
+
+    def update_from_midi_batch(self, messages: Sequence[Tuple[int, int]]) -> bool:
+        """
+        Update state from a run of MIDI messages received back to back.
+
+        All messages are applied in order under one lock acquisition and at
+        most one state notification is sent, for the final state.
+
+        Args:
+            messages: (cc, value) pairs in arrival order.
+
+        Returns:
+            True if any message changed state.
+        """
         changed = False
         notify = False
         force_notify = False  # Force notification even if state unchanged (for clipped values)
         with self._lock:
-            if cc == GLM_VOLUME_ABS:
-                self._volume_initialized = True
-                # Check if GLM clipped/adjusted our requested value
-                # If so, force notification to sync UI even if volume unchanged
-                if self._pending_volume is not None and self._pending_volume != value:
-                    logger.debug(f"volume: GLM clipped: sent {self._pending_volume}, got {value}")
-                    force_notify = True
-                # Clear pending and trust GLM's reported value as source of truth.
-                # This ensures we respect GLM's volume limits (e.g., max volume cap).
-                self._pending_volume = None
-                if self.volume != value:
-                    self.volume = value
-                    changed = True
-                # Always notify on volume to sync UI when GLM clamps values
-                notify = True
-            elif cc == GLM_MUTE_CC:
-                new_mute = value > 0
-                if self.mute != new_mute:
-                    self.mute = new_mute
-                    changed = True
-                    notify = True
-            elif cc == GLM_DIM_CC:
-                new_dim = value > 0
-                if self.dim != new_dim:
-                    self.dim = new_dim
-                    changed = True
+            s = self._state
+            for cc, value in messages:
+                if cc == GLM_VOLUME_ABS:
+                    # Check if GLM clipped/adjusted our requested value
+                    # If so, force notification to sync UI even if volume unchanged
+                    if s.pending_volume is not None and s.pending_volume != value:
+                        logger.debug(f"volume: GLM clipped: sent {s.pending_volume}, got {value}")
+                        force_notify = True
+                    # Clear pending and trust GLM's reported value as source of truth.
+                    # This ensures we respect GLM's volume limits (e.g., max volume cap).
+                    if s.volume != value:
+                        changed = True
+                    s = s._replace(volume=value, pending_volume=None, volume_initialized=True)
+                    if value != self._last_sent_volume:
+                        # GLM ignored/clipped our value or was changed elsewhere: don't suppress a resend
+                        self._last_sent_volume = -1
+                    # Always notify on volume to sync UI when GLM clamps values
                     notify = True
+                elif cc == GLM_MUTE_CC:
+                    new_mute = value > 0
+                    if s.mute != new_mute:
+                        s = s._replace(mute=new_mute)
+                        changed = True
+                        notify = True
+                elif cc == GLM_DIM_CC:
+                    new_dim = value > 0
+                    if s.dim != new_dim:
+                        s = s._replace(dim=new_dim)
+                        changed = True
+                        notify = True
+            if notify:
+                self._state = s
+
+        ack_events = self._ack_events
+        for cc, _ in messages:
+            ack = ack_events.get(cc)
+            if ack is not None:
+                ack.set()
 
         if notify:
-            self._notify_state_change(force=force_notify)
+            self._notify_state_change(s, force=force_notify)
         return changed
 
+    def wait_for_ack(self, cc: int, timeout: float) -> bool:
+        """
+        Wait until GLM echoes the given CC after the last send_action for it.
+
+        Args:
+            cc: Toggle CC that was sent (Mute/Dim)
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the echo arrived, False on timeout or for CCs GLM doesn't echo.
+        """
+        ack = self._ack_events.get(cc)
+        return ack is not None and ack.wait(timeout)
+
     def get_state(self) -> dict:
         """Get current state as a dictionary (for REST API and WebSocket)."""
-        with self._lock:
-            # Calculate remaining settling/cooldown time
-            settling_remaining = 0
-            cooldown_remaining = 0
-            in_cooldown = False
-
-            if self._power_transition_start > 0:
-                elapsed = time.time() - self._power_transition_start
-                if elapsed < POWER_SETTLING_TIME:
-                    settling_remaining = POWER_SETTLING_TIME - elapsed
-                elif elapsed < POWER_TOTAL_LOCKOUT:
-                    in_cooldown = True
-                    cooldown_remaining = POWER_TOTAL_LOCKOUT - elapsed
-
-            return {
-                "volume": self.volume,
-                "volume_db": self.volume - 127,  # 0-127 → -127 to 0 dB
-                "mute": self.mute,
-                "dim": self.dim,
-                "power": self.power,
-                "power_transitioning": self._power_settling,
-                "power_settling_remaining": round(settling_remaining, 1),
-                "power_cooldown": in_cooldown,
-                "power_cooldown_remaining": round(cooldown_remaining, 1),
-            }
+        return self._state_dict(self._state)  # One snapshot load: no lock, no torn reads
+
+    @staticmethod
+    def _state_dict(s: _GlmState) -> dict:
+        """Build the REST/WebSocket state dictionary from a snapshot."""
+        # Calculate remaining settling/cooldown time
+        now = time.monotonic()
+        settling_remaining = max(0, s.settling_deadline - now)
+        in_cooldown = not settling_remaining and now < s.lockout_deadline
+        cooldown_remaining = s.lockout_deadline - now if in_cooldown else 0
+
+        return {
+            "volume": s.volume,
+            "volume_db": s.volume - 127,  # 0-127 → -127 to 0 dB
+            "mute": s.mute,
+            "dim": s.dim,
+            "power": s.power,
+            "power_transitioning": s.power_settling,
+            "power_settling_remaining": round(settling_remaining, 1),
+            "power_cooldown": in_cooldown,
+            "power_cooldown_remaining": round(cooldown_remaining, 1),
+        }
 
     def send_volume_absolute(self, target: int, midi_output, trace_id: str = "") -> bool:
         """
         Send absolute volume command to GLM via CC 20.
         Target is clamped to 0-127 range.
-        Returns True if message was sent.
+        Returns True if message was sent (or skipped as a duplicate).
+
+        A target equal to the last value sent is skipped only once GLM has
+        confirmed it (and nothing else is pending), so a send that GLM never
+        echoed is still retried; update_from_midi clears the last-sent value
+        whenever GLM reports something different.
         """
-        target = max(0, min(127, target))
+        target = 0 if target < 0 else 127 if target > 127 else target
+        if target == self._last_sent_volume:
+            with self._lock:
+                s = self._state
+                confirmed = (s.volume_initialized and s.volume == target
+                             and s.pending_volume in (None, target))
+                if confirmed and s.pending_volume is not None:
+                    # GLM won't echo an unchanged value; drop the caller's pending mark
+                    self._state = s._replace(pending_volume=None)
+            if confirmed:
+                prefix = f"[{trace_id}] " if trace_id else ""
+                logger.debug("%svolume: %d already confirmed, skipping CC 20", prefix, target)
+                return True
+        # Record before sending so an echo racing the send isn't mistaken for a foreign change
+        self._last_sent_volume = target
         try:
-            midi_output.send(Message('control_change', control=GLM_VOLUME_ABS, value=target))
+            midi_output.send(_VOLUME_MESSAGES[target])
             log_midi("TX", "control_change", cc=GLM_VOLUME_ABS, value=target, trace_id=trace_id)
             return True
         except (OSError, IOError) as e:
+            self._last_sent_volume = -1
             prefix = f"[{trace_id}] " if trace_id else ""
             logger.debug(f"{prefix}midi.error: Failed to send volume command: {e}")
             return False
@@ -387,37 +678,27 @@ class GlmController:
 
         Returns True if message was sent.
         """
-        glm_ctrl = ACTION_TO_GLM.get(action)
-        if not glm_ctrl:
+        entry = _SEND_DISPATCH.get(action)
+        if entry is None:
             return False  # Action doesn't map to GLM
 
-        with self._lock:
-            if glm_ctrl.mode == ControlMode.TOGGLE:
-                if action == Action.MUTE:
-                    current = self.mute
-                elif action == Action.DIM:
-                    current = self.dim
-                elif action == Action.POWER:
-                    current = self.power
-                else:
-                    current = False
-
-                if explicit_state is None:
-                    # Toggle: send opposite of current
-                    value = 0 if current else 127
-                else:
-                    # Explicit: set the requested state
-                    value = 127 if explicit_state else 0
-            else:
-                # Momentary: always send 127
-                value = 127
+        if entry.current is None:
+            # Momentary: always send 127
+            value = 127
+        elif explicit_state is None:
+            # Toggle: send opposite of current
+            value = 0 if entry.current(self._state) else 127
+        else:
+            # Explicit: set the requested state
+            value = 127 if explicit_state else 0
 
-            # Note: Power state is now tracked via MIDI pattern detection in midi_reader,
-            # not here. GLM responds to power commands with a 5-message pattern that we detect.
+        ack = self._ack_events.get(entry.cc)
+        if ack is not None:
+            ack.clear()
 
         try:
-            midi_output.send(Message('control_change', control=glm_ctrl.cc, value=value))
-            log_midi("TX", "control_change", cc=glm_ctrl.cc, value=value, trace_id=trace_id)
+            midi_output.send(_cc_message(entry.cc, value))
+            log_midi("TX", "control_change", cc=entry.cc, value=value, trace_id=trace_id)
             return True
         except (OSError, IOError) as e:
             prefix = f"[{trace_id}] " if trace_id else ""
@@ -429,10 +710,19 @@ class GlmController:
 glm_controller = GlmController()
 
 
+ABOVE_NORMAL_PRIORITY_CLASS = 0x00008000  # winbase.h
+
+
 def set_higher_priority():
+    """Raise the process priority class to AboveNormal (Windows only)."""
+    if not IS_WINDOWS:
+        logger.debug("Process priority class is Windows-only, skipping")
+        return
+
     try:
-        p = psutil.Process(os.getpid())
-        p.nice(psutil.ABOVE_NORMAL_PRIORITY_CLASS)  # Set to Above Normal
+        kernel32 = ctypes.windll.kernel32
+        if not kernel32.SetPriorityClass(kernel32.GetCurrentProcess(), ABOVE_NORMAL_PRIORITY_CLASS):
+            raise ctypes.WinError(kernel32.GetLastError())
         logger.debug("Main Process priority set to AboveNormal.")
     except Exception as e:
         logger.warning(f"Failed to set higher priority: {e}")
@@ -858,10 +1148,41 @@ def restart_midi_service():
     except Exception as e:
         logger.warning(f"Failed to restart MIDI service: {e}")
 
+def _set_posix_thread_priority(priority_level):
+    """Linux: SCHED_FIFO for elevated levels (needs CAP_SYS_NICE), SCHED_IDLE for idle, else nice."""
+    thread_name = threading.current_thread().name
+    mapping = _POSIX_THREAD_PRIORITY.get(priority_level)
+    if mapping is None:
+        return
+    if priority_level == THREAD_PRIORITY_IDLE:
+        # SCHED_IDLE needs no privileges and runs only when nothing else wants the CPU
+        try:
+            os.sched_setscheduler(0, os.SCHED_IDLE, os.sched_param(0))
+            logger.debug(f"Set thread '{thread_name}' to SCHED_IDLE.")
+            return
+        except (AttributeError, PermissionError, OSError):
+            pass  # Fall back to nice
+    rt_priority, nice_value = mapping
+    if rt_priority is not None:
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(rt_priority))
+            logger.debug(f"Set thread '{thread_name}' to SCHED_FIFO priority {rt_priority}.")
+            return
+        except (PermissionError, OSError):
+            pass  # Not privileged for real-time scheduling - fall back to nice
+    try:
+        os.setpriority(os.PRIO_PROCESS, 0, nice_value)
+        logger.debug(f"Set thread '{thread_name}' nice value to {nice_value}.")
+    except (PermissionError, OSError) as e:
+        logger.debug(f"Could not set priority for thread '{thread_name}': {e}")
+
+
 def set_current_thread_priority(priority_level):
-    """Set the priority of the current thread (Windows only)."""
+    """Set the priority of the current thread (Windows, or Linux via sched/nice)."""
     if not HAS_WIN32:
-        return  # Skip on non-Windows platforms
+        if IS_LINUX:
+            _set_posix_thread_priority(priority_level)
+        return  # Skip on other platforms
 
     thread_name = threading.current_thread().name
     thread_id = threading.get_ident()
@@ -877,12 +1198,43 @@ def set_current_thread_priority(priority_level):
         logger.warning(f"Failed to set priority for thread '{thread_name}' (ID: {thread_id}): {e}")
 
 
-def signal_handler(sig, frame, daemon, stop_logging_func):
-    """Handles SIGINT and shuts down the daemon."""
+def set_current_thread_affinity(cpu: Optional[int]):
+    """Pin the current thread to one CPU (Windows, or Linux via sched_setaffinity). None = leave unpinned."""
+    if cpu is None:
+        return
+    thread_name = threading.current_thread().name
+    try:
+        if IS_WINDOWS:
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadAffinityMask.restype = ctypes.c_size_t  # DWORD_PTR previous mask, 0 = failure
+            kernel32.SetThreadAffinityMask.argtypes = (ctypes.c_void_p, ctypes.c_size_t)
+            if not kernel32.SetThreadAffinityMask(kernel32.GetCurrentThread(), 1 << cpu):
+                raise ctypes.WinError(kernel32.GetLastError())
+        elif IS_LINUX:
+            os.sched_setaffinity(0, {cpu})  # pid 0 = the calling thread on Linux
+        else:
+            return  # Skip on other platforms
+        logger.debug(f"Pinned thread '{thread_name}' to CPU {cpu}.")
+    except Exception as e:
+        logger.warning(f"Failed to pin thread '{thread_name}' to CPU {cpu}: {e}")
+
+
+def signal_handler(sig, frame, daemon):
+    """Handles SIGINT: asks the daemon to stop and returns.
+
+    The actual shutdown runs on the main thread once daemon.wait() returns,
+    not inside the handler, which may have interrupted a thread holding a lock.
+    """
     logger.info("sys.shutdown: SIGINT received, shutting down...")
-    daemon.stop()
-    stop_logging_func()
-    sys.exit(0)
+    daemon.request_stop()
+
+
+# Non-volume HID actions -> GlmAction factory (volume needs the acceleration delta)
+_HID_ACTION_BUILDERS: Dict[Action, Callable[[], object]] = {
+    Action.MUTE: SetMute,
+    Action.DIM: SetDim,
+    Action.POWER: SetPower,
+}
 
 
 class HIDToMIDIDaemon:
@@ -892,8 +1244,8 @@ class HIDToMIDIDaemon:
                  mqtt_topic="glm", mqtt_ha_discovery=True,
                  glm_manager_enabled=False, glm_path=None, glm_cpu_gating=True,
                  startup_power="on", cors_origin="*",
-                 ui_power=False, pixel_verify=False):
-        self.queue = queue.Queue(maxsize=QUEUE_MAX_SIZE)
+                 ui_power=False, pixel_verify=False, cpu_affinity=None):
+        self.queue = ActionQueue()
         self._stop_event = threading.Event()
         self.hid_reader_thread = threading.Thread(target=self.hid_reader, daemon=True, name="HIDReaderThread")
         self.midi_reader_thread = threading.Thread(target=self.midi_reader, daemon=True, name="MIDIReaderThread")
@@ -906,9 +1258,22 @@ class HIDToMIDIDaemon:
         self._midi_output = None  # Shared MIDI output for sending to GLM
         self._midi_output_lock = threading.Lock()  # Protects _midi_output access
         self.midi_input = None   # MIDI input for reading GLM state
+        self._midi_rx_queue = queue.SimpleQueue()  # Fed by the MIDI input callback; None = stop
         self.hid_device = None   # HID device handle for cleanup
         self.startup_volume = startup_volume  # Optional startup volume (0-127)
         self.bindings = DEFAULT_BINDINGS.copy()  # Instance-level key bindings
+        self._binding_table = keycode_table(self.bindings)  # Rebuild if bindings change
+        # (cc, deadline) of the last Mute/Dim sent while SEND_DELAY is set; the
+        # next action waits for GLM's echo only for what's left of the window
+        self._pending_ack: Optional[Tuple[int, float]] = None
+        # Action type -> handler(action, trace_id, prefix); one dict lookup per dispatch
+        self._action_handlers: Dict[type, Callable[[object, str, str], None]] = {
+            SetVolume: lambda a, tid, prefix: self._handle_set_volume(a.target, trace_id=tid),
+            AdjustVolume: lambda a, tid, prefix: self._handle_adjust_volume(a.delta, trace_id=tid),
+            SetMute: lambda a, tid, prefix: self._send_toggle(Action.MUTE, GLM_MUTE_CC, tid, prefix),
+            SetDim: lambda a, tid, prefix: self._send_toggle(Action.DIM, GLM_DIM_CC, tid, prefix),
+            SetPower: lambda a, tid, prefix: self._handle_power_action(a, trace_id=tid),
+        }
         self.api_port = api_port  # REST API port (0 = disabled)
         self.cors_origin = cors_origin  # CORS Allow-Origin header for REST API
         self.api_thread = None   # API server thread
@@ -921,7 +1286,10 @@ class HIDToMIDIDaemon:
         self.mqtt_ha_discovery = mqtt_ha_discovery
         self.mqtt_client = None  # MQTT client instance
         # Power pattern detection state (legacy, kept for MIDI state sync)
-        self._rx_seq = []  # List of (timestamp, cc) for pattern detection
+        self._rx_seq: deque = deque()  # (timestamp, cc) within POWER_PATTERN_WINDOW, oldest first
+        self._rx_fp = 0    # Rolling fingerprint of recent CCs (see POWER_PATTERN_FP)
+        # _rx_seq/_rx_fp belong to midi_reader; other threads only raise this flag
+        self._rx_reset_requested = False
         self._last_pattern_time = None  # For startup detection (double-burst)
         self._suppress_power_pattern = False  # Temporarily suppress pattern detection
 
@@ -932,6 +1300,9 @@ class HIDToMIDIDaemon:
         self._ui_power = ui_power          # Use UI automation (click + pixel) for power
         self._pixel_verify = pixel_verify  # Use pixel read to verify power state
 
+        # Optional (hid_cpu, consumer_cpu) thread pinning; None = unpinned
+        self._hid_cpu, self._consumer_cpu = cpu_affinity or (None, None)
+
         # Initial startup flag — prevents _reinit_power_controller from probing
         # before MIDI reader is connected. Cleared after start() does its own probe.
         self._initial_startup = True
@@ -1038,16 +1409,24 @@ class HIDToMIDIDaemon:
                 logger.warning(f"Failed to minimize GLM window: {e}")
 
     def _get_midi_output(self):
-        """Get connected MIDI output, reconnecting if necessary. Thread-safe."""
+        """Get connected MIDI output, reconnecting if necessary. Thread-safe.
+
+        Double-checked: the connected steady state is a lock-free attribute
+        load; the lock is only taken on the (re)connect path.
+        """
+        midi_out = self._midi_output
+        if midi_out is not None:
+            return midi_out
         with self._midi_output_lock:
             if self._midi_output is None:
                 try:
+                    # Publish only the fully opened port
                     self._midi_output = open_output(self.midi_in_channel)
                     logger.info(f"midi.connect: Connected to MIDI channel '{self.midi_in_channel}'")
                     retry_logger.reset("midi_output")  # Reset on successful connection
                 except (OSError, IOError) as e:
-                    if retry_logger.should_log("midi_output"):
-                        info = retry_logger.format_retry_info("midi_output")
+                    info = retry_logger.check_and_format("midi_output", logger, logging.WARNING)
+                    if info is not None:
                         logger.warning(f"midi.error: Failed to connect to '{self.midi_in_channel}': {e} {info}")
                     return None
             return self._midi_output
@@ -1055,16 +1434,38 @@ class HIDToMIDIDaemon:
     def _reset_midi_output(self):
         """Reset MIDI output connection (call after send error). Thread-safe."""
         with self._midi_output_lock:
-            if self._midi_output:
+            midi_out = self._midi_output
+            # Unpublish before closing so lock-free readers never see a closing port
+            self._midi_output = None
+            if midi_out:
                 try:
-                    self._midi_output.close()
+                    midi_out.close()
                 except (OSError, IOError):
                     logger.debug("Error closing MIDI output during reset")
-            self._midi_output = None
 
     def hid_reader(self):
         """Reads events from the HID device and puts them in the queue."""
-        set_current_thread_priority(THREAD_PRIORITY_HIGHEST)
+        # Capped at ABOVE_NORMAL like the other I/O threads: HIGHEST (in an
+        # AboveNormal process) risks starving system services for no gain,
+        # since this thread spends nearly all its time blocked in read()
+        set_current_thread_priority(THREAD_PRIORITY_ABOVE_NORMAL)
+        set_current_thread_affinity(self._hid_cpu)
+
+        # Bound once: looked up per HID report otherwise
+        binding_table = self._binding_table
+        calculate_speed = self.volume_knob.calculate_speed
+        action_builders = _HID_ACTION_BUILDERS
+        queue_put = self.queue.put
+        next_trace_id = trace_ids.next
+        monotonic = time.monotonic
+        # Click timing uses perf_counter: before Python 3.13, monotonic() on
+        # Windows ticks at ~15.6 ms, coarse next to the click thresholds
+        perf_counter = time.perf_counter
+
+        # Back off the read timeout while idle; any report resets it
+        read_timeout_ms = HID_READ_TIMEOUT_MS
+        empty_reads = 0
+
         while not self._stop_event.is_set():
             if self.hid_device is None:
                 try:
@@ -1073,51 +1474,57 @@ class HIDToMIDIDaemon:
                     logger.info(f"hid.connect: Connected to HID device VID: {hex(self.vid)} PID: {hex(self.pid)}")
                     retry_logger.reset("hid_connect")  # Reset on successful connection
                 except (OSError, IOError) as e:
-                    if retry_logger.should_log("hid_connect"):
-                        info = retry_logger.format_retry_info("hid_connect")
+                    info = retry_logger.check_and_format("hid_connect", logger, logging.WARNING)
+                    if info is not None:
                         logger.warning(f"hid.error: Failed to open HID device: {e}. Retrying... {info}")
                     self.hid_device = None
-                    time.sleep(RETRY_DELAY)
+                    if self._stop_event.wait(RETRY_DELAY):
+                        break
                     continue
 
             try:
-                report = self.hid_device.read(3, timeout_ms=HID_READ_TIMEOUT_MS)
-                if report:
-                    keyreported = report[0]
-                    if keyreported == 0:
-                        continue
-                    now = time.time()
+                report = self.hid_device.read(HID_READ_SIZE, timeout_ms=read_timeout_ms)
+                if not report:
+                    empty_reads += 1
+                    if empty_reads == HID_IDLE_READS:
+                        read_timeout_ms = HID_READ_IDLE_TIMEOUT_MS
+                    continue
+                if empty_reads:
+                    empty_reads = 0
+                    read_timeout_ms = HID_READ_TIMEOUT_MS
 
-                    # Map physical key to logical action
-                    action_type = self.bindings.get(keyreported)
-                    if not action_type:
-                        logger.debug(f"hid.input: No binding for key {KEY_NAMES.get(keyreported, keyreported)}")
-                        continue
+                keyreported = report[0]
+                if keyreported == 0:
+                    continue
+                now = monotonic()
 
-                    # Create appropriate GlmAction based on action type
-                    if action_type == Action.VOL_UP:
-                        distance = self.volume_knob.calculate_speed(now, keyreported)
-                        glm_action = AdjustVolume(delta=distance)
-                    elif action_type == Action.VOL_DOWN:
-                        distance = self.volume_knob.calculate_speed(now, keyreported)
-                        glm_action = AdjustVolume(delta=-distance)
-                    elif action_type == Action.MUTE:
-                        glm_action = SetMute()
-                    elif action_type == Action.DIM:
-                        glm_action = SetDim()
-                    elif action_type == Action.POWER:
-                        glm_action = SetPower()
-                    else:
+                # Map physical key to logical action
+                action_type = binding_table[keyreported]
+                if action_type is None:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("hid.input: No binding for key %s", KEY_NAME_TABLE[keyreported])
+                    continue
+
+                # Create appropriate GlmAction based on action type
+                if action_type == Action.VOL_UP:
+                    glm_action = AdjustVolume(delta=calculate_speed(perf_counter(), keyreported))
+                elif action_type == Action.VOL_DOWN:
+                    glm_action = AdjustVolume(delta=-calculate_speed(perf_counter(), keyreported))
+                else:
+                    build = action_builders.get(action_type)
+                    if build is None:
                         # Non-GLM actions (PLAY_PAUSE, etc.) - skip for now
-                        logger.debug(f"hid.input: Action {action_type.value} not yet supported")
+                        logger.debug("hid.input: Action %s not yet supported", action_type.value)
                         continue
+                    glm_action = build()
 
-                    tid = trace_ids.next("hid")
-                    self.queue.put(QueuedAction(action=glm_action, timestamp=now, trace_id=tid))
-                    logger.debug(f"[{tid}] hid.input: key={KEY_NAMES.get(keyreported, keyreported)} -> {glm_action}")
+                tid = next_trace_id("hid")
+                queue_put(QueuedAction(action=glm_action, timestamp=now, trace_id=tid))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[%s] hid.input: key=%s -> %s", tid, KEY_NAME_TABLE[keyreported], glm_action)
             except (OSError, IOError) as e:
-                if retry_logger.should_log("hid_error"):
-                    info = retry_logger.format_retry_info("hid_error")
+                info = retry_logger.check_and_format("hid_error", logger, logging.WARNING)
+                if info is not None:
                     logger.warning(f"hid.error: Device error: {e}. Reconnecting... {info}")
                 if self.hid_device:
                     try:
@@ -1126,31 +1533,76 @@ class HIDToMIDIDaemon:
                         logger.debug("Error closing HID device during reconnect")
                 self.hid_device = None
                 retry_logger.reset("hid_connect")  # Reset connect tracker since we need to reconnect
-                time.sleep(RETRY_DELAY)
+                if self._stop_event.wait(RETRY_DELAY):
+                    break
+
+    def _reset_power_pattern(self):
+        """Forget recent RX CCs so the next power pattern needs 5 fresh messages.
+
+        Safe from any thread: only raises a flag. midi_reader, which owns
+        _rx_seq and _rx_fp, clears them before it handles the next CC.
+        """
+        self._rx_reset_requested = True
+
+    def _iter_midi_rx(self):
+        """
+        Yield received MIDI messages until the stop sentinel (None).
+
+        Blocks on the driver-fed queue (no polling). On each wake-up, drains
+        everything queued so far and applies its control changes to
+        glm_controller in one batch (one lock, at most one notification)
+        before yielding the messages for per-message handling. State is
+        updated first, as it was per message (like Go's UpdateFromMIDI).
+        """
+        rx_queue = self._midi_rx_queue
+        while True:
+            batch = [rx_queue.get()]
+            try:
+                while batch[-1] is not None:
+                    batch.append(rx_queue.get_nowait())
+            except queue.Empty:
+                pass
+            stop = batch[-1] is None
+            if stop:
+                batch.pop()
+
+            ccs = [(msg.control, msg.value) for msg in batch if msg.type == 'control_change']
+            if ccs and glm_controller.update_from_midi_batch(ccs) and logger.isEnabledFor(logging.DEBUG):
+                state = glm_controller.get_state()
+                logger.debug("state.change: vol=%s, mute=%s, dim=%s, pwr=%s",
+                             state['volume'], state['mute'], state['dim'], state['power'])
+
+            yield from batch
+            if stop:
+                return
 
     def midi_reader(self):
         """Reads MIDI messages from GLMOUT and updates GLM state."""
         set_current_thread_priority(THREAD_PRIORITY_ABOVE_NORMAL)  # Match consumer for balanced send/receive
 
+        # Bound once: used per received CC
+        monotonic = time.monotonic
+        stop_requested = self._stop_event.is_set
+        rx_seq = self._rx_seq  # Only this thread touches it (see _reset_power_pattern)
+        log_enabled = logger.isEnabledFor  # Level cache lives in logging; re-checked per message
+
         while not self._stop_event.is_set():
             try:
-                self.midi_input = open_input(self.midi_out_channel)
+                # The driver thread pushes messages straight into the queue; this
+                # thread does the processing so slow paths (RF follow-through
+                # settle) never stall the driver's callback thread.
+                self.midi_input = open_input(self.midi_out_channel, callback=self._midi_rx_queue.put)
                 logger.info(f"midi.connect: Connected to MIDI output channel '{self.midi_out_channel}' for state reading")
                 retry_logger.reset("midi_reader")  # Reset on successful connection
 
-                # Blocking iteration - waits for messages, no polling
-                for msg in self.midi_input:
-                    if self._stop_event.is_set():
+                # State updates are applied per batch inside _iter_midi_rx
+                for msg in self._iter_midi_rx():
+                    if stop_requested():
                         break
                     # Log ALL received MIDI messages
                     if msg.type == 'control_change':
-                        log_midi("RX", "control_change", cc=msg.control, value=msg.value)
-
-                        # Process state update FIRST (unconditional, like Go's UpdateFromMIDI)
-                        changed = glm_controller.update_from_midi(msg.control, msg.value)
-                        if changed:
-                            state = glm_controller.get_state()
-                            logger.debug(f"state.change: vol={state['volume']}, mute={state['mute']}, dim={state['dim']}, pwr={state['power']}")
+                        if log_enabled(logging.INFO):
+                            log_midi("RX", "control_change", cc=msg.control, value=msg.value)
 
                         # Count CC20 for startup burst probe BEFORE pattern detection
                         # (pattern detection uses 'continue' which would skip this)
@@ -1160,22 +1612,34 @@ class HIDToMIDIDaemon:
                                 self._probe_condition.notify()
 
                         # Power pattern detection
-                        now = time.time()
-                        self._rx_seq.append((now, msg.control))
-                        # Keep only messages within time window
-                        self._rx_seq = [(t, c) for (t, c) in self._rx_seq
-                                       if now - t <= POWER_PATTERN_WINDOW]
-
-                        seq = [c for _, c in self._rx_seq]
-                        if len(seq) >= 5 and seq[-5:] == POWER_PATTERN:
-                            time_span = self._rx_seq[-1][0] - self._rx_seq[-5][0]
+                        now = monotonic()
+                        if self._rx_reset_requested:
+                            self._rx_reset_requested = False
+                            rx_seq.clear()
+                            self._rx_fp = 0
+                        if msg.control not in POWER_PATTERN_SET:
+                            # Breaks any sequence in progress; keep only its timestamp
+                            # so the pre-gap check still sees this message
+                            rx_seq.clear()
+                            rx_seq.append((now, msg.control))
+                            self._rx_fp = 0
+                            continue
+                        rx_seq.append((now, msg.control))
+                        self._rx_fp = ((self._rx_fp << 8) | msg.control) & POWER_PATTERN_FP_MASK
+                        # Keep only messages within time window (entries are time-ordered)
+                        while now - rx_seq[0][0] > POWER_PATTERN_WINDOW:
+                            rx_seq.popleft()
+
+                        # One int compare for the CC sequence; timing checks only on a match
+                        if self._rx_fp == POWER_PATTERN_FP and len(rx_seq) >= POWER_PATTERN_LEN:
+                            time_span = rx_seq[-1][0] - rx_seq[-POWER_PATTERN_LEN][0]
                             if time_span >= POWER_PATTERN_MIN_SPAN:  # Not a buffer dump
                                 # Early pre-gap check: if pattern is clearly embedded in a
                                 # message stream (< 50ms silence before), skip full gap analysis
-                                if len(self._rx_seq) > 5:
-                                    pre_gap = self._rx_seq[-5][0] - self._rx_seq[-6][0]
+                                if len(rx_seq) > POWER_PATTERN_LEN:
+                                    pre_gap = rx_seq[-POWER_PATTERN_LEN][0] - rx_seq[-POWER_PATTERN_LEN - 1][0]
                                     if pre_gap < 0.05:
-                                        self._rx_seq = []
+                                        self._reset_power_pattern()
                                         continue
                                 else:
                                     pre_gap = float('inf')  # No prior message = isolated burst
@@ -1187,8 +1651,8 @@ class HIDToMIDIDaemon:
                                 # 3. Pre-gap before pattern > PRE_GAP (120ms) - primary defense
                                 # RF remote bursts: uniform ~31ms gaps, total ~124ms
                                 # GUI clicks via RDP: gap[1] can reach ~243ms, total ~316ms
-                                pattern_times = [t for t, _ in self._rx_seq[-5:]]
-                                gaps = [pattern_times[i+1] - pattern_times[i] for i in range(4)]
+                                pattern_times = [rx_seq[i][0] for i in range(-POWER_PATTERN_LEN, 0)]
+                                gaps = [pattern_times[i+1] - pattern_times[i] for i in range(POWER_PATTERN_LEN - 1)]
                                 max_gap = max(gaps)
                                 total_gap = sum(gaps)
 
@@ -1202,13 +1666,13 @@ class HIDToMIDIDaemon:
                                     if pre_gap < POWER_PATTERN_PRE_GAP:
                                         reason.append(f"pre-gap {pre_gap*1000:.0f}ms < {POWER_PATTERN_PRE_GAP*1000:.0f}ms")
                                     logger.debug(f"power.pattern: Rejected: {', '.join(reason)} (gaps: {[f'{g*1000:.0f}ms' for g in gaps]})")
-                                    self._rx_seq = []
+                                    self._reset_power_pattern()
                                     continue
 
                                 # Skip pattern processing during startup/volume init
                                 if self._suppress_power_pattern:
                                     logger.debug("power.pattern: Ignored (suppressed during init)")
-                                    self._rx_seq = []
+                                    self._reset_power_pattern()
                                     continue
 
                                 # Skip pattern processing during power cooldown
@@ -1216,7 +1680,7 @@ class HIDToMIDIDaemon:
                                 allowed, wait_time, _ = glm_controller.can_accept_power_command()
                                 if not allowed:
                                     logger.debug(f"power.pattern: Ignored during cooldown ({wait_time:.1f}s remaining)")
-                                    self._rx_seq = []
+                                    self._reset_power_pattern()
                                     continue
 
                                 # --- Self-ACK suppression ---
@@ -1224,30 +1688,29 @@ class HIDToMIDIDaemon:
                                 # back its own 5-message pattern. The cooldown check above
                                 # (can_accept_power_command) already handles this, but
                                 # double-check the transition timestamp explicitly.
-                                if glm_controller._power_transition_start > 0:
-                                    elapsed_since_transition = time.time() - glm_controller._power_transition_start
-                                    if elapsed_since_transition < POWER_TOTAL_LOCKOUT:
-                                        logger.debug(f"power.pattern: Self-ACK suppressed ({elapsed_since_transition:.1f}s into lockout)")
-                                        self._last_pattern_time = time.time()
-                                        self._rx_seq = []
-                                        continue
+                                lockout_left = glm_controller._state.lockout_deadline - time.monotonic()
+                                if lockout_left > 0:
+                                    elapsed_since_transition = POWER_TOTAL_LOCKOUT - lockout_left
+                                    logger.debug(f"power.pattern: Self-ACK suppressed ({elapsed_since_transition:.1f}s into lockout)")
+                                    self._last_pattern_time = time.monotonic()
+                                    self._reset_power_pattern()
+                                    continue
 
                                 # --- Startup duplicate suppression ---
                                 # GLM can emit duplicate bursts during startup. Suppress
                                 # patterns that arrive within 3s of a previous match.
                                 if self._last_pattern_time is not None:
-                                    since_last_pattern = time.time() - self._last_pattern_time
+                                    since_last_pattern = time.monotonic() - self._last_pattern_time
                                     if since_last_pattern < POWER_STARTUP_WINDOW:
                                         logger.debug(f"power.pattern: Startup duplicate suppressed ({since_last_pattern:.1f}s since last)")
-                                        self._last_pattern_time = time.time()
-                                        self._rx_seq = []
+                                        self._last_pattern_time = time.monotonic()
+                                        self._reset_power_pattern()
                                         continue
 
                                 # --- Follow-through logic ---
                                 # External RF remote toggled power. Send CC28 to align
                                 # deterministic state, matching Go behavior.
-                                with glm_controller._lock:
-                                    target_power = not glm_controller.power
+                                target_power = not glm_controller.power
 
                                 logger.info(f"power.pattern: RF power toggle detected - sending CC28 follow-through to {'ON' if target_power else 'OFF'}")
 
@@ -1258,18 +1721,15 @@ class HIDToMIDIDaemon:
                                 midi_out = self._get_midi_output()
                                 if midi_out is not None:
                                     try:
-                                        midi_out.send(Message('control_change', control=GLM_POWER_CC, value=cc28_value))
+                                        midi_out.send(_cc_message(GLM_POWER_CC, cc28_value))
                                         log_midi("TX", "control_change", cc=GLM_POWER_CC, value=cc28_value, trace_id="ext-followthrough")
                                     except (OSError, IOError) as e:
                                         logger.warning(f"power.pattern: CC28 send failed: {e}, falling back to state flip only")
                                         midi_out = None  # Signal failure for fallback below
 
                                 # Update controller state
-                                with glm_controller._lock:
-                                    glm_controller.power = target_power
-                                    glm_controller._power_transition_start = time.time()
-                                glm_controller._notify_state_change()
-                                self._last_pattern_time = time.time()
+                                glm_controller.set_power(target_power, mark_transition=True, notify=True)
+                                self._last_pattern_time = time.monotonic()
 
                                 if midi_out is None:
                                     logger.warning(f"power.pattern: No MIDI output - state flipped to {'ON' if target_power else 'OFF'} without CC28")
@@ -1289,9 +1749,7 @@ class HIDToMIDIDaemon:
                                             if actual_state in ("on", "off"):
                                                 actual_power = (actual_state == "on")
                                                 if actual_power != expected_power:
-                                                    with glm_controller._lock:
-                                                        glm_controller.power = actual_power
-                                                    glm_controller._notify_state_change()
+                                                    glm_controller.set_power(actual_power, notify=True)
                                                     logger.warning(f"power.verify: Corrected state to {'ON' if actual_power else 'OFF'} (follow-through said {'ON' if expected_power else 'OFF'})")
                                                 else:
                                                     logger.debug(f"power.verify: Confirmed {'ON' if actual_power else 'OFF'}")
@@ -1306,18 +1764,20 @@ class HIDToMIDIDaemon:
                                         name="PowerVerify",
                                     ).start()
 
-                                self._rx_seq = []  # Clear after detection
+                                self._reset_power_pattern()  # Clear after detection
 
                     else:
                         # Log non-control_change messages (unexpected but want to see them)
-                        log_midi("RX", msg.type, raw=str(msg))
+                        if log_enabled(logging.INFO):
+                            log_midi("RX", msg.type, raw=str(msg))
 
             except (OSError, IOError) as e:
                 if not self._stop_event.is_set():  # Only log if not shutting down
-                    if retry_logger.should_log("midi_reader"):
-                        info = retry_logger.format_retry_info("midi_reader")
+                    info = retry_logger.check_and_format("midi_reader", logger, logging.WARNING)
+                    if info is not None:
                         logger.warning(f"midi.error: Reader error: {e}. Reconnecting... {info}")
-                    time.sleep(RETRY_DELAY)
+                    if self._stop_event.wait(RETRY_DELAY):
+                        break
             finally:
                 if self.midi_input:
                     try:
@@ -1329,66 +1789,142 @@ class HIDToMIDIDaemon:
     def consumer(self):
         """Processes GlmAction objects from the queue and sends MIDI messages."""
         set_current_thread_priority(THREAD_PRIORITY_ABOVE_NORMAL)
+        set_current_thread_affinity(self._consumer_cpu)
 
         # Wait for initial MIDI connection
-        while self._get_midi_output() is None and not self._stop_event.is_set():
-            time.sleep(RETRY_DELAY)
-
-        while True:
-            queued = self.queue.get()
-            if queued is None:  # Sentinel for consumer shutdown
-                logger.info("sys.shutdown: Consumer thread exiting")
+        while self._get_midi_output() is None:
+            if self._stop_event.wait(RETRY_DELAY):
                 break
 
-            # Handle QueuedAction objects
-            now = time.time()
-            event_age = now - queued.timestamp
-            tid = queued.trace_id
-            prefix = f"[{tid}] " if tid else ""
+        # Bound once: looked up per action otherwise
+        queue_get = self.queue.get
+        monotonic = time.monotonic
+        stop_requested = self._stop_event.is_set
+        process_action = self._process_action
 
-            if event_age > MAX_EVENT_AGE:
-                logger.warning(f"{prefix}queue.stale: Discarded {queued.action} (age={event_age:.1f}s)")
+        while not stop_requested():
+            queued = queue_get()
+            if queued is None:  # Woken by stop() with nothing queued
                 continue
 
-            action = queued.action
+            process_action(queued, monotonic())
 
-            # Check if commands are blocked during power settling
-            if isinstance(action, SetPower):
-                # Power commands have extended cooldown
-                allowed, wait_time, reason = glm_controller.can_accept_power_command()
-                if not allowed:
-                    if reason == "power_settling":
-                        logger.warning(f"{prefix}power.blocked: settling ({wait_time:.1f}s remaining)")
-                    else:
-                        logger.warning(f"{prefix}power.blocked: cooldown ({wait_time:.1f}s remaining)")
-                    continue
-            else:
-                # All other commands blocked only during settling
-                allowed, wait_time, reason = glm_controller.can_accept_command()
-                if not allowed:
-                    logger.warning(f"{prefix}queue.blocked: power settling ({wait_time:.1f}s remaining)")
-                    continue
+        logger.info("sys.shutdown: Consumer thread exiting")
 
-            # Dispatch based on action type
-            try:
-                if isinstance(action, SetVolume):
-                    self._handle_set_volume(action.target, trace_id=tid)
-                elif isinstance(action, AdjustVolume):
-                    self._handle_adjust_volume(action.delta, trace_id=tid)
-                elif isinstance(action, SetMute):
-                    logger.debug(f"{prefix}midi.tx: Sending Mute (CC {GLM_MUTE_CC})")
-                    self._send_action(Action.MUTE, trace_id=tid)
-                    time.sleep(SEND_DELAY)
-                elif isinstance(action, SetDim):
-                    logger.debug(f"{prefix}midi.tx: Sending Dim (CC {GLM_DIM_CC})")
-                    self._send_action(Action.DIM, trace_id=tid)
-                    time.sleep(SEND_DELAY)
-                elif isinstance(action, SetPower):
-                    self._handle_power_action(action, trace_id=tid)
+    def _process_action(self, queued: QueuedAction, now: float):
+        """
+        Check and dispatch one QueuedAction. Runs only on the consumer thread.
+
+        Args:
+            queued: The action with its timestamp and trace ID.
+            now: Current time.monotonic() for the staleness check.
+        """
+        event_age = now - queued.timestamp
+        tid = queued.trace_id
+        prefix = f"[{tid}] " if tid else ""
+
+        if event_age > MAX_EVENT_AGE:
+            logger.warning(f"{prefix}queue.stale: Discarded {queued.action} (age={event_age:.1f}s)")
+            return
+
+        action = queued.action
+        action_type = type(action)  # Action dataclasses are final: "is" replaces isinstance
+
+        # Coalesce a burst of same-direction knob steps into one adjustment,
+        # and a run of absolute sets (slider drags) into the latest one
+        if action_type is AdjustVolume:
+            action = self._coalesce_adjust_volume(action, prefix)
+        elif action_type is SetVolume:
+            action = self._coalesce_set_volume(action, prefix)
+
+        # Check if commands are blocked during power settling
+        if action_type is SetPower:
+            # Power commands have extended cooldown
+            allowed, wait_time, reason = glm_controller.can_accept_power_command()
+            if not allowed:
+                if reason == "power_settling":
+                    logger.warning(f"{prefix}power.blocked: settling ({wait_time:.1f}s remaining)")
                 else:
-                    logger.debug(f"{prefix}queue.unknown: {type(action).__name__}")
-            except Exception as e:
-                logger.error(f"{prefix}queue.error: Processing {action}: {e}", exc_info=True)
+                    logger.warning(f"{prefix}power.blocked: cooldown ({wait_time:.1f}s remaining)")
+                return
+        else:
+            # All other commands blocked only during settling
+            allowed, wait_time, reason = glm_controller.can_accept_command()
+            if not allowed:
+                logger.warning(f"{prefix}queue.blocked: power settling ({wait_time:.1f}s remaining)")
+                return
+
+        # Dispatch based on action type
+        handler = self._action_handlers.get(action_type)
+        if handler is None:
+            logger.debug(f"{prefix}queue.unknown: {action_type.__name__}")
+            return
+        pending_ack = self._pending_ack
+        if pending_ack is not None:
+            self._pending_ack = None
+            remaining = pending_ack[1] - time.monotonic()
+            if remaining > 0:
+                glm_controller.wait_for_ack(pending_ack[0], remaining)
+        try:
+            handler(action, tid, prefix)
+        except Exception as e:
+            logger.error(f"{prefix}queue.error: Processing {action}: {e}", exc_info=True)
+
+    def _send_toggle(self, action: Action, cc: int, trace_id: str, prefix: str):
+        """Send a Mute/Dim toggle, optionally pacing the next action on GLM's echo (SEND_DELAY)."""
+        logger.debug("%smidi.tx: Sending %s (CC %d)", prefix, action.value, cc)
+        self._send_action(action, trace_id=trace_id)
+        if SEND_DELAY:
+            # Don't block now: _process_action waits before the next dispatch,
+            # and only if that comes before the echo and the deadline
+            self._pending_ack = (cc, time.monotonic() + SEND_DELAY)
+
+    def _coalesce_adjust_volume(self, action: AdjustVolume, prefix: str = "") -> AdjustVolume:
+        """
+        Merge queued AdjustVolume actions in the same direction into one.
+
+        Under fast knob rotation several steps queue up while the previous
+        volume command is in flight; sending them as one CC 20 keeps GLM from
+        dropping messages. Opposite directions are not merged so clamping at
+        0/127 behaves exactly as if the steps were sent one by one.
+        """
+        delta = action.delta
+        merged = 0
+        while merged < MAX_COALESCE:
+            nxt = self.queue.peek()
+            if nxt is None or not isinstance(nxt.action, AdjustVolume):
+                break
+            if (nxt.action.delta > 0) != (delta > 0):
+                break
+            self.queue.get()  # Non-blocking: peek() just saw it
+            delta += nxt.action.delta
+            merged += 1
+
+        if not merged:
+            return action
+        logger.debug("%squeue.coalesce: merged %d volume steps, delta=%+d", prefix, merged + 1, delta)
+        return AdjustVolume(delta=delta)
+
+    def _coalesce_set_volume(self, action: SetVolume, prefix: str = "") -> SetVolume:
+        """
+        Replace a run of queued SetVolume actions with the last one.
+
+        Absolute targets supersede each other, so only the newest needs to
+        reach GLM (e.g. a REST/web slider being dragged).
+        """
+        merged = 0
+        while merged < MAX_COALESCE:
+            nxt = self.queue.peek()
+            if nxt is None or not isinstance(nxt.action, SetVolume):
+                break
+            self.queue.get()  # Non-blocking: peek() just saw it
+            action = nxt.action
+            merged += 1
+
+        if merged:
+            logger.debug("%squeue.coalesce: skipped %d superseded volume sets, target=%d",
+                         prefix, merged, action.target)
+        return action
 
     def _send_action(self, action: Action, trace_id: str = ""):
         """Send an action to GLM using the controller."""
@@ -1435,7 +1971,7 @@ class HIDToMIDIDaemon:
 
             # Start power transition (blocks all commands)
             glm_controller.start_power_transition(target_state, trace_id=trace_id)
-            transition_start = time.time()
+            transition_start = time.monotonic()
 
             # Ensure session is connected to console before UI automation
             if ensure_session_connected:
@@ -1452,7 +1988,7 @@ class HIDToMIDIDaemon:
                 logger.error(f"{prefix}power.error: UI automation failed: {e}")
 
             # Wait for full settling time before ending transition
-            elapsed = time.time() - transition_start
+            elapsed = time.monotonic() - transition_start
             if elapsed < POWER_SETTLING_TIME:
                 remaining = POWER_SETTLING_TIME - elapsed
                 logger.debug(f"{prefix}power.settling: Waiting {remaining:.1f}s")
@@ -1475,7 +2011,7 @@ class HIDToMIDIDaemon:
 
             cc28_value = 127 if target_state else 0
             try:
-                midi_out.send(Message('control_change', control=GLM_POWER_CC, value=cc28_value))
+                midi_out.send(_cc_message(GLM_POWER_CC, cc28_value))
                 log_midi("TX", "control_change", cc=GLM_POWER_CC, value=cc28_value, trace_id=trace_id)
                 glm_controller.end_power_transition(success=True, actual_state=target_state)
             except (OSError, IOError) as e:
@@ -1503,28 +2039,23 @@ class HIDToMIDIDaemon:
             return
 
         try:
-            # Atomically check if volume is initialized and get effective volume
-            current = glm_controller.get_volume_if_valid()
+            # Target is based on effective volume (pending or confirmed) so consecutive
+            # commands accumulate before GLM confirms; it is pended in the same step
+            current, target = glm_controller.compute_and_pend_volume(delta)
             if current is not None:
-                # Calculate target volume based on effective volume (pending or confirmed)
-                # This allows consecutive commands to accumulate before GLM confirms
-                target = max(0, min(127, current + delta))
-
                 if target != current:
-                    sign = '+' if delta > 0 else ''
-                    logger.debug(f"{prefix}volume: {current} -> {target} (delta={sign}{delta}, CC 20)")
-                    glm_controller.set_pending_volume(target)
+                    logger.debug("%svolume: %d -> %d (delta=%+d, CC 20)", prefix, current, target, delta)
                     glm_controller.send_volume_absolute(target, midi_out, trace_id=trace_id)
                     # Clear power pattern buffer - GLM's response (DIM, MUTE, VOL)
                     # should not be mistaken for power toggle pattern
-                    self._rx_seq = []
+                    self._reset_power_pattern()
                 else:
                     direction = "up" if delta > 0 else "down"
-                    logger.debug(f"{prefix}volume: Already at limit ({current}), ignoring {direction}")
+                    logger.debug("%svolume: Already at limit (%d), ignoring %s", prefix, current, direction)
             else:
                 # Volume not initialized yet - use CC 21/22 to trigger GLM state report
                 action = Action.VOL_UP if delta > 0 else Action.VOL_DOWN
-                logger.debug(f"{prefix}volume: Not initialized, using {action.value} (CC 21/22) to trigger state")
+                logger.debug("%svolume: Not initialized, using %s (CC 21/22) to trigger state", prefix, action.value)
                 glm_controller.send_action(action, midi_out, trace_id=trace_id)
         except (OSError, IOError) as e:
             logger.error(f"{prefix}midi.error: Volume action failed: {e}")
@@ -1544,13 +2075,13 @@ class HIDToMIDIDaemon:
             logger.warning(f"{prefix}midi.error: Output not connected, skipping volume action")
             return
 
-        target = max(0, min(127, target))
+        target = 0 if target < 0 else 127 if target > 127 else target
         try:
-            logger.debug(f"{prefix}volume: Setting to {target} (CC 20)")
+            logger.debug("%svolume: Setting to %d (CC 20)", prefix, target)
             glm_controller.set_pending_volume(target)
             glm_controller.send_volume_absolute(target, midi_out, trace_id=trace_id)
             # Clear power pattern buffer - GLM's response should not trigger pattern
-            self._rx_seq = []
+            self._reset_power_pattern()
         except (OSError, IOError) as e:
             logger.error(f"{prefix}midi.error: Setting volume failed: {e}")
             self._reset_midi_output()
@@ -1570,8 +2101,8 @@ class HIDToMIDIDaemon:
         midi_out = None
         while midi_out is None and not self._stop_event.is_set():
             midi_out = self._get_midi_output()
-            if midi_out is None:
-                time.sleep(RETRY_DELAY)
+            if midi_out is None and self._stop_event.wait(RETRY_DELAY):
+                break
 
         if midi_out is None:
             return  # Shutting down
@@ -1641,7 +2172,7 @@ class HIDToMIDIDaemon:
 
             # Send CC28 power command
             try:
-                midi_out.send(Message('control_change', control=GLM_POWER_CC, value=power_value))
+                midi_out.send(_cc_message(GLM_POWER_CC, power_value))
                 log_midi("TX", "control_change", cc=GLM_POWER_CC, value=power_value, trace_id=init_tid)
             except (OSError, IOError) as e:
                 logger.error(f"[{init_tid}] probe: failed to send CC28: {e}")
@@ -1659,9 +2190,7 @@ class HIDToMIDIDaemon:
 
             # Update power state on controller
             target_power = (self._startup_power == "on")
-            with glm_controller._lock:
-                glm_controller.power = target_power
-            glm_controller._notify_state_change()
+            glm_controller.set_power(target_power, notify=True)
 
             # Log final discovered state
             state = glm_controller.get_state()
@@ -1675,7 +2204,7 @@ class HIDToMIDIDaemon:
             # Clear suppression and probe state
             self._startup_consuming = False
             self._suppress_power_pattern = False
-            self._rx_seq = []
+            self._reset_power_pattern()
 
         # Apply startup volume override if requested
         if self.startup_volume is not None:
@@ -1708,9 +2237,9 @@ class HIDToMIDIDaemon:
             target = received_at_start + i + 1
 
             with self._probe_condition:
-                deadline = time.time() + timeout
+                deadline = time.monotonic() + timeout
                 while self._probe_cc20_count < target:
-                    remaining = deadline - time.time()
+                    remaining = deadline - time.monotonic()
                     if remaining <= 0:
                         # Timed out waiting for this message
                         actual = self._probe_cc20_count - received_at_start
@@ -1740,12 +2269,10 @@ class HIDToMIDIDaemon:
             power_label = "ON" if self._startup_power == "on" else "OFF"
             logger.info(f"[{trace_id}] probe: sending CC28 startup power (target={power_label})")
             try:
-                midi_out.send(Message('control_change', control=GLM_POWER_CC, value=power_value))
+                midi_out.send(_cc_message(GLM_POWER_CC, power_value))
                 log_midi("TX", "control_change", cc=GLM_POWER_CC, value=power_value, trace_id=trace_id)
                 target_power = (self._startup_power == "on")
-                with glm_controller._lock:
-                    glm_controller.power = target_power
-                glm_controller._notify_state_change()
+                glm_controller.set_power(target_power, notify=True)
             except (OSError, IOError) as e:
                 logger.error(f"[{trace_id}] probe: CC28 startup power send failed: {e}")
                 return
@@ -1762,7 +2289,7 @@ class HIDToMIDIDaemon:
         finally:
             self._startup_consuming = False
             self._suppress_power_pattern = False
-            self._rx_seq = []
+            self._reset_power_pattern()
 
         if glm_controller.has_valid_volume:
             logger.info(f"[{trace_id}] sys.init: GLM state discovered: volume={glm_controller.volume}")
@@ -1782,8 +2309,8 @@ class HIDToMIDIDaemon:
         midi_out = None
         while midi_out is None and not self._stop_event.is_set():
             midi_out = self._get_midi_output()
-            if midi_out is None:
-                time.sleep(RETRY_DELAY)
+            if midi_out is None and self._stop_event.wait(RETRY_DELAY):
+                break
 
         if midi_out is None:
             return  # Shutting down
@@ -1812,7 +2339,7 @@ class HIDToMIDIDaemon:
             time.sleep(GLM_VOL_RESPONSE_WAIT)
         finally:
             # Clear power pattern buffer and re-enable detection
-            self._rx_seq = []
+            self._reset_power_pattern()
             self._suppress_power_pattern = False
 
         if glm_controller.has_valid_volume:
@@ -1858,7 +2385,7 @@ class HIDToMIDIDaemon:
             try:
                 state = self._power_controller.get_state()
                 if state in ("on", "off"):
-                    glm_controller.power = (state == "on")
+                    glm_controller.set_power(state == "on")
                     logger.info(f"power.init: State synced from GLM UI: {state.upper()}")
                 else:
                     logger.warning(f"Could not determine GLM power state: {state}")
@@ -1906,11 +2433,19 @@ class HIDToMIDIDaemon:
             logger.info("Minimizing GLM window (post-startup)")
             self._power_controller.minimize()
 
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until stop() is called or timeout expires. Returns True if stopped."""
+        return self._stop_event.wait(timeout)
+
+    def request_stop(self):
+        """Signal all threads to stop without waiting (safe from a signal handler)."""
+        self._stop_event.set()
+        self.queue.wake()  # Unblock the consumer so it sees the stop event
+
     def stop(self):
         """Stops the daemon gracefully."""
         logger.info("sys.shutdown: Stopping daemon...")
-        self._stop_event.set()
-        self.queue.put(None)  # Sentinel to unblock the consumer
+        self.request_stop()
 
         # Stop GLM Manager watchdog (but don't kill GLM - let it keep running)
         if self._glm_manager:
@@ -1920,7 +2455,8 @@ class HIDToMIDIDaemon:
         if self.mqtt_client:
             self.mqtt_client.stop()
 
-        # Close MIDI input to unblock the blocking read
+        # Unblock the MIDI reader and close its input port
+        self._midi_rx_queue.put(None)
         if self.midi_input:
             try:
                 self.midi_input.close()
@@ -1939,9 +2475,14 @@ class HIDToMIDIDaemon:
         # Close MIDI output
         self._reset_midi_output()
 
-        # Give threads a moment to exit cleanly (they're daemon threads)
-        # This allows graceful shutdown but doesn't block if they're stuck
-        time.sleep(0.1)
+        glm_controller.stop_notifications()
+
+        # Let threads exit cleanly, bounded by one shared deadline: they're
+        # daemon threads, so a stuck one doesn't block process exit
+        deadline = time.monotonic() + SHUTDOWN_JOIN_TIMEOUT
+        for thread in (self.consumer_thread, self.midi_reader_thread, self.hid_reader_thread):
+            if thread.is_alive():
+                thread.join(max(0.0, deadline - time.monotonic()))
 
         logger.info("sys.shutdown: Daemon stopped")
 
@@ -2054,14 +2595,24 @@ if __name__ == "__main__":
     for _line in _banner_lines:
         logger.debug(_line)
 
-    # Check if another instance is already running (by checking if API port is in use)
+    # Check if another instance is already running (by trying to bind the API port)
     if args.api_port > 0:
         import socket
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(1)
-        result = sock.connect_ex(('127.0.0.1', args.api_port))
-        sock.close()
-        if result == 0:
+        if hasattr(socket, "SO_EXCLUSIVEADDRUSE"):
+            # Windows: without this a bind can share a port already in use
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+        else:
+            # POSIX: ignore TIME_WAIT leftovers, still fails on a listener
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind(('', args.api_port))
+            port_in_use = False
+        except OSError:
+            port_in_use = True
+        finally:
+            sock.close()
+        if port_in_use:
             logger.error(f"Another instance is already running (port {args.api_port} in use). Exiting.")
             stop_logging()  # Stop logging thread before exit
             sys.exit(1)
@@ -2110,14 +2661,27 @@ if __name__ == "__main__":
         args.cors_origin,
         ui_power=args.ui_power,
         pixel_verify=args.pixel_verify,
+        cpu_affinity=args.cpu_affinity,
     )
-    signal.signal(signal.SIGINT, lambda sig, frame: signal_handler(sig, frame, daemon, stop_logging))
+    signal.signal(signal.SIGINT, lambda sig, frame: signal_handler(sig, frame, daemon))
     daemon.start()
+    # Objects from imports and startup (FastAPI app, UI automation handles, ...)
+    # live for the whole run: freeze them so full collections only scan
+    # what the event paths allocate. Collection itself stays on, since the
+    # UI automation and web stacks do create reference cycles.
+    gc.freeze()
 
     try:
-        while True:
-            time.sleep(3)  # Keep the main thread alive
+        # Keep the main thread alive until the daemon stops
+        if IS_WINDOWS:
+            # Event.wait() can't be interrupted by Ctrl+C on Windows; time.sleep() can
+            while not daemon.wait(0):
+                time.sleep(MAIN_WAIT_TIMEOUT)
+        else:
+            daemon.wait()  # No wake-ups at all; signals still interrupt it
     except KeyboardInterrupt:
-        signal_handler(None, None, daemon, stop_logging)
+        pass
     finally:
+        # Orderly shutdown from the main thread: daemon threads first, logging last
+        daemon.stop()
         stop_logging()
@@ -5,9 +5,17 @@ Handles CLI argument parsing and validation for the GLM Manager application.
 """
 
 import argparse
+import functools
 import os
+import re
 import sys
-from typing import List, Tuple
+from typing import List, Optional, Sequence, Tuple
+
+# Compiled once; validators run for every CLI value they are given.
+_INT_LIST_RE = re.compile(r'^\s*\[?\s*(\d+(?:\s*,\s*\d+)*)\s*\]?\s*$')
+_FLOAT_PAIR_RE = re.compile(r'^\s*(\d+(?:\.\d*)?|\.\d+)\s*,\s*(\d+(?:\.\d*)?|\.\d+)\s*$')
+_DEVICE_RE = re.compile(r'^\s*(?:0[xX])?([0-9a-fA-F]{1,4})\s*,\s*(?:0[xX])?([0-9a-fA-F]{1,4})\s*$')
+_INT_PAIR_RE = re.compile(r'^\s*(\d+)\s*,\s*(\d+)\s*$')
 
 
 def _print_usage():
@@ -70,6 +78,8 @@ VM AUTOMATION (override defaults for fine-tuning)
   --no_midi_restart      Disable MIDI service restart
   --high_priority        Set process priority to AboveNormal (default true)
   --no_high_priority     Run at normal priority
+  --cpu_affinity HID,CONSUMER
+                         Pin the HID reader and consumer threads to these CPUs (default: unpinned)
 
 VOLUME ACCELERATION
   --min_click_time SEC   Min seconds between clicks (default 0.2)
@@ -98,15 +108,15 @@ def validate_volume_increases(value: str) -> List[int]:
     Raises:
         argparse.ArgumentTypeError: If validation fails
     """
-    try:
-        parsed = list(map(int, value.strip("[]").split(",")))
-        if len(parsed) < 2 or len(parsed) > 15:
-            raise argparse.ArgumentTypeError("Volume increase list must have between 2 and 15 items.")
-        if not all(1 <= x <= 10 for x in parsed):
-            raise argparse.ArgumentTypeError("All values in the list must be integers between 1 and 10.")
-        return parsed
-    except ValueError as e:
-        raise argparse.ArgumentTypeError(f"Invalid format for volume_increase_list: {e}")
+    m = _INT_LIST_RE.match(value)
+    if not m:
+        raise argparse.ArgumentTypeError(f"Invalid format for volume_increase_list: {value!r}")
+    parsed = [int(x) for x in m.group(1).split(",")]
+    if not 2 <= len(parsed) <= 15:
+        raise argparse.ArgumentTypeError("Volume increase list must have between 2 and 15 items.")
+    if not (1 <= min(parsed) and max(parsed) <= 10):
+        raise argparse.ArgumentTypeError("All values in the list must be integers between 1 and 10.")
+    return parsed
 
 
 def validate_click_times(values: str) -> Tuple[float, float]:
@@ -122,23 +132,65 @@ def validate_click_times(values: str) -> Tuple[float, float]:
     Raises:
         argparse.ArgumentTypeError: If validation fails
     """
-    try:
-        # Split and parse the two values
-        parsed = list(map(float, values.split(",")))
-        if len(parsed) != 2:
+    m = _FLOAT_PAIR_RE.match(values)
+    if not m:
+        if values.count(",") != 1:
             raise argparse.ArgumentTypeError("You must provide exactly two values: MIN_CLICK_TIME,MAX_AVG_CLICK_TIME.")
+        raise argparse.ArgumentTypeError("Click times must be two float values separated by a comma.")
+
+    min_click_time, max_avg_click_time = float(m.group(1)), float(m.group(2))
+
+    # Validate the values
+    if not (0.01 < min_click_time < 1):
+        raise argparse.ArgumentTypeError("MIN_CLICK_TIME must be > 0.01 and < 1.")
+    if max_avg_click_time > min_click_time:
+        raise argparse.ArgumentTypeError("MAX_AVG_CLICK_TIME must be <= MIN_CLICK_TIME.")
+
+    return min_click_time, max_avg_click_time
 
-        min_click_time, max_avg_click_time = parsed
 
-        # Validate the values
-        if not (0.01 < min_click_time < 1):
-            raise argparse.ArgumentTypeError("MIN_CLICK_TIME must be > 0.01 and < 1.")
-        if max_avg_click_time > min_click_time:
-            raise argparse.ArgumentTypeError("MAX_AVG_CLICK_TIME must be <= MIN_CLICK_TIME.")
+def validate_midi_value(value: str) -> int:
+    """
+    Validate and parse a 7-bit MIDI value.
+
+    Args:
+        value: Integer string in 0-127
 
-        return min_click_time, max_avg_click_time
+    Returns:
+        The value as int
+
+    Raises:
+        argparse.ArgumentTypeError: If validation fails
+    """
+    try:
+        parsed = int(value)
     except ValueError:
-        raise argparse.ArgumentTypeError("Click times must be two float values separated by a comma.")
+        raise argparse.ArgumentTypeError(f"Invalid MIDI value: {value!r}. Must be an integer 0-127.") from None
+    if not 0 <= parsed <= 127:
+        raise argparse.ArgumentTypeError(f"MIDI value {parsed} out of range. Must be 0-127.")
+    return parsed
+
+
+def validate_port(value: str) -> int:
+    """
+    Validate and parse a TCP port number.
+
+    Args:
+        value: Integer string in 0-65535 (0 disables the API server)
+
+    Returns:
+        The port as int
+
+    Raises:
+        argparse.ArgumentTypeError: If validation fails
+    """
+    try:
+        parsed = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid port: {value!r}. Must be an integer 0-65535.") from None
+    if not 0 <= parsed <= 65535:
+        raise argparse.ArgumentTypeError(f"Port {parsed} out of range. Must be 0-65535.")
+    return parsed
 
 
 def validate_device(value: str) -> Tuple[int, int]:
@@ -154,24 +206,46 @@ def validate_device(value: str) -> Tuple[int, int]:
     Raises:
         argparse.ArgumentTypeError: If validation fails
     """
-    try:
-        vid, pid = map(lambda x: int(x, 16), value.split(","))
-        if vid < 0x0000 or vid > 0xFFFF or pid < 0x0000 or pid > 0xFFFF:
-            raise argparse.ArgumentTypeError("VID and PID must be valid 16-bit hexadecimal values.")
-        return vid, pid
-    except ValueError as e:
-        raise argparse.ArgumentTypeError(f"Invalid VID/PID format: {e}")
+    m = _DEVICE_RE.match(value)
+    if not m:
+        raise argparse.ArgumentTypeError(
+            f"Invalid VID/PID format: {value!r}. VID and PID must be valid 16-bit hexadecimal values.")
+    return int(m.group(1), 16), int(m.group(2), 16)
 
 
-def parse_arguments(script_file: str = None):
+def validate_cpu_affinity(value: str) -> Tuple[int, int]:
     """
-    Parse command-line arguments.
+    Validate and parse the HID reader / consumer CPU pair.
 
     Args:
-        script_file: Path to the main script file (for default log file name)
+        value: Comma-separated CPU indices (e.g., "0,1")
 
     Returns:
-        Parsed arguments namespace
+        Tuple of (hid_cpu, consumer_cpu)
+
+    Raises:
+        argparse.ArgumentTypeError: If validation fails
+    """
+    m = _INT_PAIR_RE.match(value)
+    if not m:
+        raise argparse.ArgumentTypeError(f"Invalid CPU pair: {value!r}. Expected HID_CPU,CONSUMER_CPU (e.g., 0,1).")
+    hid_cpu, consumer_cpu = int(m.group(1)), int(m.group(2))
+    cpu_count = os.cpu_count() or 1
+    if hid_cpu >= cpu_count or consumer_cpu >= cpu_count:
+        raise argparse.ArgumentTypeError(f"CPU index out of range. This machine has CPUs 0-{cpu_count - 1}.")
+    return hid_cpu, consumer_cpu
+
+
+@functools.lru_cache(maxsize=None)
+def build_parser(script_file: str = None) -> argparse.ArgumentParser:
+    """
+    Build the argument parser (once per script_file; later calls reuse it).
+
+    Args:
+        script_file: Path to the main script file (unused; --log_file_name has a fixed default)
+
+    Returns:
+        Configured ArgumentParser
     """
     parser = argparse.ArgumentParser(
         description="GLM Manager - HID to MIDI Agent for Genelec GLM control.",
@@ -180,12 +254,6 @@ def parse_arguments(script_file: str = None):
     parser.add_argument("-h", "--help", action="store_true", default=False,
                         help=argparse.SUPPRESS)
 
-    # Determine default log file name
-    if script_file:
-        default_log_file = os.path.splitext(os.path.basename(script_file))[0] + ".log"
-    else:
-        default_log_file = "glm_manager.log"
-
     parser.add_argument("--log_level", choices=["DEBUG", "INFO", "NONE"], default="DEBUG",
                         help="Set logging level. Default is DEBUG.")
 
@@ -215,6 +283,8 @@ def parse_arguments(script_file: str = None):
                         help="Enable process priority boost (default: enabled).")
     parser.add_argument("--no_high_priority", dest="high_priority", action="store_false",
                         help="Disable process priority boost.")
+    parser.add_argument("--cpu_affinity", type=validate_cpu_affinity, default=None, metavar="HID,CONSUMER",
+                        help="Pin the HID reader and consumer threads to these CPU indices. Default: unpinned.")
 
     # Startup power state (P0-3)
     parser.add_argument("--startup_power", choices=["on", "off"], default="on",
@@ -246,12 +316,12 @@ def parse_arguments(script_file: str = None):
     parser.add_argument("--midi_out_channel", type=str, default="GLMOUT 1",
                         help="MIDI output channel name (to receive state FROM GLM). Default is 'GLMOUT 1'.")
 
-    parser.add_argument("--startup_volume", type=int, default=None, choices=range(0, 128), metavar="0-127",
+    parser.add_argument("--startup_volume", type=validate_midi_value, default=None, metavar="0-127",
                         help="Optional startup volume (0-127). If set, GLM volume will be set to this value on startup. "
                              "79 corresponds to -46dB in GLM. If not set, script will query current volume.")
 
     # REST API
-    parser.add_argument("--api_port", type=int, default=8080,
+    parser.add_argument("--api_port", type=validate_port, default=8080,
                         help="Port for REST API server. Set to 0 to disable API. Default is 8080.")
     parser.add_argument("--cors_origin", type=str, default="*",
                         help="CORS Allow-Origin header for the REST API. Default is '*' (allow all).")
@@ -259,7 +329,7 @@ def parse_arguments(script_file: str = None):
     # MQTT / Home Assistant
     parser.add_argument("--mqtt_broker", type=str, default=None,
                         help="MQTT broker hostname. If not set, MQTT is disabled.")
-    parser.add_argument("--mqtt_port", type=int, default=1883,
+    parser.add_argument("--mqtt_port", type=validate_port, default=1883,
                         help="MQTT broker port. Default is 1883.")
     parser.add_argument("--mqtt_user", type=str, default=None,
                         help="MQTT username (optional).")
@@ -284,8 +354,21 @@ def parse_arguments(script_file: str = None):
     parser.add_argument("--no_glm_cpu_gating", action="store_false", dest="glm_cpu_gating",
                         help="Disable CPU gating for GLM startup.")
 
-    # Parse arguments
-    args = parser.parse_args()
+    return parser
+
+
+def parse_arguments(script_file: str = None, argv: Optional[Sequence[str]] = None):
+    """
+    Parse command-line arguments.
+
+    Args:
+        script_file: Path to the main script file (unused; --log_file_name has a fixed default)
+        argv: Arguments to parse instead of sys.argv[1:]
+
+    Returns:
+        Parsed arguments namespace
+    """
+    args = build_parser(script_file).parse_args(argv)
 
     # Custom help output
     if args.help:
@@ -10,6 +10,7 @@ from .actions import (
     TraceIdGenerator,
     trace_ids,
 )
+from .action_queue import ActionQueue
 
 __all__ = [
     'GlmAction',
@@ -21,4 +22,5 @@ __all__ = [
     'QueuedAction',
     'TraceIdGenerator',
     'trace_ids',
+    'ActionQueue',
 ]
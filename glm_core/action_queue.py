@@ -0,0 +1,72 @@
+"""
+ActionQueue - lock-free action pipeline from input adapters to the consumer.
+
+All input adapters (HID, REST, MQTT) put QueuedActions; a single consumer
+thread gets them. Backed by collections.deque, whose append/popleft are
+atomic under the GIL, plus a threading.Event to wake the consumer.
+"""
+import threading
+from collections import deque
+from typing import Any
+
+
+class ActionQueue:
+    """Multi-producer / single-consumer queue without a mutex per operation.
+
+    Unbounded, so put() never blocks and never drops an action (a queued
+    SetPower or SetMute must not be lost); stale volume steps are discarded
+    by the consumer's age check instead.
+    """
+
+    def __init__(self):
+        self._items: deque = deque()
+        self._ready = threading.Event()
+        self._wake = False
+
+    def put(self, item: Any):
+        """Append an item and wake the consumer. Safe from any thread."""
+        self._items.append(item)
+        # Event.set() takes the Condition lock; skip it while the consumer is
+        # already awake. get() clears before re-checking _items, so an item
+        # appended above is seen either way.
+        if not self._ready.is_set():
+            self._ready.set()
+
+    def get(self) -> Any:
+        """Remove and return the oldest item, blocking until one is available.
+
+        Returns None if wake() was called while the queue was empty.
+        Must only be called from the single consumer thread.
+        """
+        while True:
+            try:
+                return self._items.popleft()
+            except IndexError:
+                pass
+            if self._wake:
+                self._wake = False
+                return None
+            self._ready.clear()
+            # Re-check after clear: a put() or wake() between popleft and
+            # clear would otherwise wait for the next wake-up.
+            if not self._items and not self._wake:
+                self._ready.wait()
+
+    def wake(self):
+        """Unblock a waiting get() without queueing an item (e.g. on shutdown)."""
+        self._wake = True
+        self._ready.set()
+
+    def peek(self) -> Any:
+        """Return the oldest item without removing it, or None if empty.
+
+        Must only be called from the single consumer thread (producers only
+        append, so the head cannot change underneath it).
+        """
+        try:
+            return self._items[0]
+        except IndexError:
+            return None
+
+    def __len__(self) -> int:
+        return len(self._items)
@@ -5,7 +5,7 @@ These represent what the system should do, independent of input source.
 All input adapters (HID, REST, MQTT) create these actions and submit to the queue.
 """
 import threading
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Optional, Union
 
 
@@ -32,31 +32,31 @@ class TraceIdGenerator:
 trace_ids = TraceIdGenerator()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SetVolume:
     """Set absolute volume level (0-127 MIDI value)."""
     target: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AdjustVolume:
     """Relative volume change. Positive = up, negative = down."""
     delta: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SetMute:
     """Set or toggle mute state. None = toggle."""
     state: Optional[bool] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SetDim:
     """Set or toggle dim state. None = toggle."""
     state: Optional[bool] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SetPower:
     """
     Set or toggle power state.
@@ -81,15 +81,15 @@ class SetPower:
 GlmAction = Union[SetVolume, AdjustVolume, SetMute, SetDim, SetPower]
 
 
-@dataclass
+@dataclass(slots=True)
 class QueuedAction:
     """
     Wrapper for actions in the queue, carrying timestamp and trace ID.
 
-    Input adapters create QueuedAction(action=..., timestamp=time.time(), trace_id=trace_ids.next("source"))
+    Input adapters create QueuedAction(action=..., timestamp=time.monotonic(), trace_id=trace_ids.next("source"))
     and submit to the queue. Consumer checks timestamp to discard stale events.
     The trace_id follows the action through HID→Queue→Consumer→MIDI TX for log correlation.
     """
     action: GlmAction
-    timestamp: float
+    timestamp: float  # time.monotonic(), immune to wall-clock jumps
     trace_id: str = ""
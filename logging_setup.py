@@ -2,22 +2,155 @@
 Logging Setup for GLM Manager.
 
 Provides centralized logging configuration with:
-- Rotating file handler
+- Rotating file handler, buffered and written in batches
 - Console handler
-- Async queue-based logging for thread safety
+- Async logging through a lock-free ring buffer drained by one thread
 - WebSocket error filtering
 """
 
 import logging
 import os
 import threading
-from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
-from queue import Queue
-from typing import Callable, Optional
+import time
+from collections import deque
+from logging.handlers import RotatingFileHandler, MemoryHandler
+from typing import Callable, List, Optional, Sequence
 
 # Centralized logging format with thread, module, function, and line number
 LOG_FORMAT = '%(asctime)s [%(levelname)s] %(threadName)s %(module)s:%(funcName)s:%(lineno)d - %(message)s'
 
+# File writes are batched: flushed when the buffer fills, on WARNING+, or by
+# the logging thread every LOG_FLUSH_INTERVAL seconds.
+LOG_BUFFER_CAPACITY = 256
+LOG_FLUSH_INTERVAL = 1.0  # seconds
+LOG_RING_CAPACITY = 10000  # Records held for the logging thread (oldest dropped beyond this)
+
+
+class SharedFormatter(logging.Formatter):
+    """Formatter shared by the file and console handlers that formats each record once.
+
+    The formatted line is stored on the record, so an INFO+ record that goes
+    to both handlers is not formatted twice on the logging thread. The
+    strftime part of the timestamp is cached per second.
+    """
+
+    def __init__(self, fmt: Optional[str] = None):
+        super().__init__(fmt)
+        self._time_cache = (None, "")  # (whole second, strftime text); one tuple so it swaps atomically
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        secs = int(record.created)
+        cached_secs, text = self._time_cache
+        if secs != cached_secs:
+            text = time.strftime(self.default_time_format, self.converter(record.created))
+            self._time_cache = (secs, text)
+        return self.default_msec_format % (text, record.msecs)
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = record.__dict__.get("_formatted")
+        if line is None:
+            line = record._formatted = super().format(record)
+        return line
+
+
+class BatchRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that can write many records with one write + flush."""
+
+    def write_batch(self, records: Sequence[logging.LogRecord]):
+        """Format records that pass this handler's level/filters and write them at once."""
+        level = self.level
+        lines = [self.format(r) + self.terminator for r in records
+                 if r.levelno >= level and self.filter(r)]
+        if not lines:
+            return
+        text = "".join(lines)
+        with self.lock:
+            try:
+                if self.stream is None:
+                    self.stream = self._open()
+                # Rotate per batch instead of per record: a file may overshoot
+                # maxBytes by at most one batch
+                if self.maxBytes > 0 and self.stream.tell() + len(text) >= self.maxBytes and self.stream.tell():
+                    self.doRollover()
+                self.stream.write(text)
+                self.stream.flush()
+            except Exception:
+                self.handleError(records[-1])
+
+
+class BatchMemoryHandler(MemoryHandler):
+    """MemoryHandler whose flush() hands the whole buffer to write_batch()."""
+
+    def flush(self):
+        with self.lock:
+            if self.buffer and self.target is not None:
+                self.target.write_batch(self.buffer)
+                self.buffer.clear()
+
+
+class RingBufferHandler(logging.Handler):
+    """
+    Hands log records to a single logging thread without taking a lock.
+
+    emit() appends to a bounded deque (atomic under the GIL) and sets an
+    Event; the logging thread drains the deque into the real handlers.
+    Once close() has run, records are written synchronously instead, so
+    messages logged during shutdown are not stranded in the buffer.
+    """
+
+    def __init__(self, handlers: List[logging.Handler], capacity: int = LOG_RING_CAPACITY):
+        super().__init__()
+        self._handlers = handlers
+        self._ring: deque = deque(maxlen=capacity)
+        self._ready = threading.Event()
+        self._direct = False
+
+    def handle(self, record: logging.LogRecord):
+        # Overridden to skip Handler's per-record lock: emit() is lock-free
+        rv = self.filter(record)
+        if rv:
+            self.emit(rv if isinstance(rv, logging.LogRecord) else record)
+        return rv
+
+    def emit(self, record: logging.LogRecord):
+        if self._direct:
+            self._dispatch(record)
+            return
+        self._ring.append(record)
+        self._ready.set()
+
+    def _dispatch(self, record: logging.LogRecord):
+        for handler in self._handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def wait(self, timeout: float):
+        """Block the logging thread until records arrive or timeout."""
+        self._ready.wait(timeout)
+        self._ready.clear()
+
+    def wake(self):
+        """Unblock wait() (used on shutdown)."""
+        self._ready.set()
+
+    def drain(self):
+        """Write all buffered records to the target handlers (logging thread only)."""
+        ring = self._ring
+        while True:
+            try:
+                record = ring.popleft()
+            except IndexError:
+                return
+            self._dispatch(record)
+
+    def close(self):
+        self.drain()
+        self._direct = True
+        self.drain()  # Records appended while switching over
+        super().close()
+
 
 def setup_logging(
     log_level: str,
@@ -47,9 +180,17 @@ def setup_logging(
     Returns:
         Tuple of (logger, stop_logging_func)
     """
-    log_file_path = os.path.join(script_dir, log_file_name)
+    # LOG_FORMAT only uses the thread name: skip collecting process and
+    # asyncio task info in every LogRecord (logAsyncioTasks is 3.12+)
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False
 
-    log_queue = Queue()
+    log_file_path = os.path.join(script_dir, log_file_name)
+    formatter = SharedFormatter(LOG_FORMAT)
+    # With "NONE" every handler drops below CRITICAL anyway; raising the logger
+    # levels too lets isEnabledFor() short-circuit before any record is built.
+    logger_level = {"DEBUG": logging.DEBUG, "INFO": logging.INFO}.get(log_level, logging.CRITICAL)
 
     # Import WebSocket error filter to suppress disconnect errors in logs
     try:
@@ -59,27 +200,34 @@ def setup_logging(
         ws_filter = None
 
     # File Handler
-    file_handler = RotatingFileHandler(log_file_path, maxBytes=max_bytes, backupCount=backup_count)
+    file_handler = BatchRotatingFileHandler(log_file_path, maxBytes=max_bytes, backupCount=backup_count)
     file_handler.setLevel(logging.DEBUG if log_level != "NONE" else logging.CRITICAL)
-    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    file_handler.setFormatter(formatter)
     if ws_filter:
         file_handler.addFilter(ws_filter)
 
+    # Buffer file records so hot threads (HID, consumer) don't pay for a
+    # write + flush per DEBUG line; each flush is a single write. Errors
+    # still reach disk immediately.
+    buffered_file_handler = BatchMemoryHandler(
+        LOG_BUFFER_CAPACITY, flushLevel=logging.WARNING, target=file_handler, flushOnClose=True)
+    buffered_file_handler.setLevel(file_handler.level)
+
     # Console Handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO if log_level in ["INFO", "DEBUG"] else logging.CRITICAL)
-    console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    console_handler.setFormatter(formatter)
     if ws_filter:
         console_handler.addFilter(ws_filter)
 
-    # QueueHandler
-    queue_handler = QueueHandler(log_queue)
+    # Ring buffer: every logger hands records to the logging thread
+    ring_handler = RingBufferHandler([buffered_file_handler, console_handler])
 
     # Root Logger
     root_logger = logging.getLogger()
     root_logger.handlers = []  # Clear all handlers
-    root_logger.setLevel(logging.DEBUG if log_level == "DEBUG" else logging.INFO)
-    root_logger.addHandler(queue_handler)
+    root_logger.setLevel(logger_level)
+    root_logger.addHandler(ring_handler)
 
     # Suppress verbose debug logging from third-party libraries
     logging.getLogger("keyring").setLevel(logging.WARNING)
@@ -87,12 +235,11 @@ def setup_logging(
 
     # Module Logger
     logger = logging.getLogger(__name__)
-    logger.setLevel(logging.DEBUG if log_level == "DEBUG" else logging.INFO)
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    logger.setLevel(logger_level)
+    logger.addHandler(ring_handler)
     logger.propagate = False  # Avoid double logging
 
-    # Listener Thread
+    # Logging Thread
     stop_event = threading.Event()
 
     # Log startup message
@@ -100,20 +247,26 @@ def setup_logging(
     logger.info(f"sys.init: >----- Starting {script_name}{version_str}. Initializing...")
 
     def log_listener_thread():
-        listener = QueueListener(log_queue, file_handler, console_handler)
-        listener.start()
-
         # Lower thread priority if function provided
         if set_thread_priority_func:
             set_thread_priority_func(thread_priority_idle)
 
-        stop_event.wait()
-        listener.stop()
+        last_flush = time.monotonic()
+        while not stop_event.is_set():
+            ring_handler.wait(LOG_FLUSH_INTERVAL)
+            ring_handler.drain()
+            now = time.monotonic()
+            if now - last_flush >= LOG_FLUSH_INTERVAL:
+                buffered_file_handler.flush()
+                last_flush = now
+        ring_handler.close()  # Drains the rest, then switches to synchronous writes
+        buffered_file_handler.flush()
 
     logging_thread = threading.Thread(target=log_listener_thread, name="LoggingThread", daemon=False)
     logging_thread.start()
 
     def stop_logging():
         stop_event.set()
+        ring_handler.wake()
 
     return logger, stop_logging
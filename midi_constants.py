@@ -5,9 +5,10 @@ Contains all MIDI CC numbers, enums, and mappings between
 logical actions and GLM MIDI controls.
 """
 
-from dataclasses import dataclass
+import logging
 from enum import Enum
-from typing import Dict
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, NamedTuple, Tuple
 
 
 # ==============================================================================
@@ -35,8 +36,7 @@ class ControlMode(Enum):
     TOGGLE = "toggle"        # Send 127/0 to set state explicitly
 
 
-@dataclass(frozen=True)
-class GlmControl:
+class GlmControl(NamedTuple):
     cc: int                 # MIDI CC number
     label: str              # Human-readable label
     mode: ControlMode       # How this control behaves
@@ -52,7 +52,16 @@ GLM_POWER_CC = 28     # System Power (momentary trigger, no MIDI feedback)
 
 # Power detection pattern: MUTE -> VOL -> DIM -> MUTE -> VOL (5 messages within ~150ms)
 # GLM sends this pattern on power toggle and startup (startup sends 7 then 5)
-POWER_PATTERN = [GLM_MUTE_CC, GLM_VOLUME_ABS, GLM_DIM_CC, GLM_MUTE_CC, GLM_VOLUME_ABS]
+POWER_PATTERN = (GLM_MUTE_CC, GLM_VOLUME_ABS, GLM_DIM_CC, GLM_MUTE_CC, GLM_VOLUME_ABS)
+POWER_PATTERN_LEN = len(POWER_PATTERN)
+POWER_PATTERN_SET = frozenset(POWER_PATTERN)  # Any other CC cannot be part of a match
+# Rolling fingerprint of the last POWER_PATTERN_LEN CCs, 8 bits each:
+#   fp = ((fp << 8) | cc) & POWER_PATTERN_FP_MASK; match when fp == POWER_PATTERN_FP
+POWER_PATTERN_FP_MASK = (1 << (8 * POWER_PATTERN_LEN)) - 1
+POWER_PATTERN_FP = 0
+for _cc in POWER_PATTERN:
+    POWER_PATTERN_FP = (POWER_PATTERN_FP << 8) | _cc
+del _cc
 POWER_PATTERN_WINDOW = 0.5  # seconds - max time window for pattern
 POWER_PATTERN_MIN_SPAN = 0.05  # seconds - min span (faster = buffer dump, ignore)
 POWER_PATTERN_MAX_GAP = 0.26  # seconds - max gap between any two consecutive messages (260ms)
@@ -66,30 +75,43 @@ POWER_PATTERN_PRE_GAP = 0.12  # seconds - min gap before first message (120ms) t
 # False positives (volume changes): embedded in stream with ~30ms between messages
 POWER_STARTUP_WINDOW = 3.0  # seconds - if second pattern within this, it's GLM startup
 
-# CC number to human-readable name (for logging)
-CC_NAMES: Dict[int, str] = {
+class _CCNameDict(dict):
+    """CC name table that formats and caches "CC<n>" for unnamed CCs on first use."""
+
+    def __missing__(self, cc: int) -> str:
+        name = self[cc] = f"CC{cc}"
+        return name
+
+
+# CC number to human-readable name (for logging); CC_NAMES[cc] never raises
+CC_NAMES: Dict[int, str] = _CCNameDict({
     GLM_VOLUME_ABS: "Volume",
     GLM_VOL_UP_CC: "Vol+",
     GLM_VOL_DOWN_CC: "Vol-",
     GLM_MUTE_CC: "Mute",
     GLM_DIM_CC: "Dim",
     GLM_POWER_CC: "Power",
-}
+})
+
+MIDI_CC_COUNT = 128  # Valid CC numbers are 0-127
+
+# CC number -> name as a tuple for the per-message log path (indexing, no hashing)
+CC_NAME_TABLE: Tuple[str, ...] = tuple(CC_NAMES.get(cc) or f"CC{cc}" for cc in range(MIDI_CC_COUNT))
 
 # Catalogue of GLM controls
-ACTION_TO_GLM: Dict[Action, GlmControl] = {
+ACTION_TO_GLM: Mapping[Action, GlmControl] = MappingProxyType({
     Action.VOL_UP:   GlmControl(cc=GLM_VOL_UP_CC,   label="Vol+",  mode=ControlMode.MOMENTARY),
     Action.VOL_DOWN: GlmControl(cc=GLM_VOL_DOWN_CC, label="Vol-",  mode=ControlMode.MOMENTARY),
     Action.MUTE:     GlmControl(cc=GLM_MUTE_CC,     label="Mute",  mode=ControlMode.TOGGLE),
     Action.DIM:      GlmControl(cc=GLM_DIM_CC,      label="Dim",   mode=ControlMode.TOGGLE),
     Action.POWER:    GlmControl(cc=GLM_POWER_CC,    label="Power", mode=ControlMode.TOGGLE),
     # Non-GLM actions don't have GLM controls (yet)
-}
+})
 
 # Reverse lookup: CC number -> Action (for reading GLM state from MIDI output)
-CC_TO_ACTION: Dict[int, Action] = {
+CC_TO_ACTION: Mapping[int, Action] = MappingProxyType({
     ctrl.cc: action for action, ctrl in ACTION_TO_GLM.items()
-}
+})
 
 
 # ==============================================================================
@@ -103,28 +125,43 @@ KEY_DOUBLE_CLICK = 16   # Double click on VOL20
 KEY_TRIPLE_CLICK = 8    # Triple click on VOL20
 KEY_LONG_PRESS = 4      # 2-second press on VOL20
 
-KEY_NAMES: Dict[int, str] = {
+KEY_NAMES: Mapping[int, str] = MappingProxyType({
     KEY_VOL_UP: "VolUp",
     KEY_VOL_DOWN: "VolDown",
     KEY_CLICK: "Click",
     KEY_DOUBLE_CLICK: "DblClick",
     KEY_TRIPLE_CLICK: "TplClick",
     KEY_LONG_PRESS: "LongPress",
-}
+})
+
+HID_KEYCODE_COUNT = 256  # Keycodes are the first byte of a HID report
+
+
+def keycode_table(mapping: Mapping[int, Any], default: Any = None) -> List[Any]:
+    """Expand a keycode dict into a list indexed directly by keycode (0-255)."""
+    table = [default] * HID_KEYCODE_COUNT
+    for key, value in mapping.items():
+        table[key] = value
+    return table
+
+
+# Keycode -> name for logging; unnamed keycodes map to the number itself
+KEY_NAME_TABLE: Tuple[Any, ...] = tuple(KEY_NAMES.get(k, k) for k in range(HID_KEYCODE_COUNT))
 
 
 # ==============================================================================
 # 4) KEY BINDINGS - Map physical keys to logical actions (configurable)
 # ==============================================================================
 
-DEFAULT_BINDINGS: Dict[int, Action] = {
+# Read-only: daemons take a copy() (a plain dict) to customize
+DEFAULT_BINDINGS: Mapping[int, Action] = MappingProxyType({
     KEY_VOL_UP: Action.VOL_UP,
     KEY_VOL_DOWN: Action.VOL_DOWN,
     KEY_CLICK: Action.POWER,         # Click -> Power
     KEY_DOUBLE_CLICK: Action.DIM,    # Double click -> Dim
     KEY_TRIPLE_CLICK: Action.DIM,    # Triple click -> Dim
     KEY_LONG_PRESS: Action.MUTE,     # Long press -> Mute
-}
+})
 
 
 def log_midi(logger, direction: str, msg_type: str, cc: int = None, value: int = None, channel: int = None, raw: str = None, trace_id: str = ""):
@@ -141,18 +178,25 @@ def log_midi(logger, direction: str, msg_type: str, cc: int = None, value: int =
         raw: Raw message string for unknown types
         trace_id: Optional trace ID for correlation (e.g., "hid-0042")
     """
+    # Called for every MIDI message in both directions: bail out before any
+    # formatting when INFO is filtered, and let logging format lazily otherwise.
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     prefix = f"[{trace_id}] " if trace_id else ""
-    category = f"midi.{'tx' if direction == 'TX' else 'rx'}"
+    category = "midi.tx" if direction == "TX" else "midi.rx"
 
     if msg_type == "control_change" and cc is not None:
-        cc_name = CC_NAMES.get(cc, f"CC{cc}")
-        logger.info(f"{prefix}{category}: {cc_name}(CC{cc})={value}")
+        logger.info("%s%s: %s(CC%d)=%s", prefix, category, CC_NAME_TABLE[cc], cc, value)
     elif raw:
-        logger.info(f"{prefix}{category}: {raw}")
+        logger.info("%s%s: %s", prefix, category, raw)
     else:
-        parts = [f"{prefix}{category}: {msg_type}"]
+        fmt = "%s%s: %s"
+        args = [prefix, category, msg_type]
         if channel is not None:
-            parts.append(f"ch={channel}")
+            fmt += " ch=%s"
+            args.append(channel)
         if value is not None:
-            parts.append(f"val={value}")
-        logger.info(" ".join(parts))
+            fmt += " val=%s"
+            args.append(value)
+        logger.info(fmt, *args)
@@ -6,8 +6,10 @@ Retries continue at their normal frequency, but log messages are throttled
 based on elapsed time since the first failure.
 """
 
+import logging
 import threading
 import time
+from dataclasses import dataclass
 from typing import Dict, List, Optional
 
 # Smart retry logging intervals (absolute milestones from first event)
@@ -18,6 +20,15 @@ from typing import Dict, List, Optional
 RETRY_LOG_INTERVALS = [2, 10, 60, 600, 3600, 86400]  # 2s, 10s, 1min, 10min, 1hr, 1day
 
 
+@dataclass(slots=True)
+class _Tracker:
+    """Per-key retry state."""
+    first_event_time: float  # time.monotonic() of the first failure
+    next_log_time: float     # Next milestone, seconds from first_event_time
+    interval_index: int      # Index of next_log_time in the milestone schedule
+    retry_count: int
+
+
 class SmartRetryLogger:
     """
     Manages smart logging during retry loops using absolute time milestones.
@@ -44,9 +55,18 @@ class SmartRetryLogger:
                       Defaults to RETRY_LOG_INTERVALS.
         """
         self.intervals = intervals or RETRY_LOG_INTERVALS
-        self._trackers: Dict[str, dict] = {}
+        self._trackers: Dict[str, _Tracker] = {}
         self._lock = threading.Lock()
 
+        # Precompute the milestone schedule (seconds from first event) once;
+        # past the end it continues in steps of the last interval.
+        deadlines = []
+        prev_log_time = 0
+        for interval in self.intervals:
+            prev_log_time = self._compute_next_log_time(prev_log_time, interval)
+            deadlines.append(prev_log_time)
+        self._deadlines = tuple(deadlines)
+
     def _compute_next_log_time(self, prev_log_time: float, interval: float) -> float:
         """
         Compute next log time using the milestone rule.
@@ -58,6 +78,13 @@ class SmartRetryLogger:
             return interval
         return prev_log_time + interval
 
+    def _deadline(self, index: int) -> float:
+        """Return the index-th log milestone (seconds from first event)."""
+        deadlines = self._deadlines
+        if index < len(deadlines):
+            return deadlines[index]
+        return deadlines[-1] + (index - len(deadlines) + 1) * self.intervals[-1]
+
     def should_log(self, key: str) -> bool:
         """
         Check if we should log a retry message for the given key.
@@ -68,48 +95,43 @@ class SmartRetryLogger:
         Returns:
             True if enough time has passed since first event, False otherwise.
         """
-        now = time.time()
+        now = time.monotonic()
+
+        # Fast path: dict.get is atomic under the GIL, so known keys skip the lock.
+        tracker = self._trackers.get(key)
+        if tracker is None:
+            with self._lock:
+                if key not in self._trackers:
+                    # First attempt - always log
+                    self._trackers[key] = _Tracker(
+                        first_event_time=now,
+                        next_log_time=self._deadlines[0],
+                        interval_index=0,
+                        retry_count=1,
+                    )
+                    return True
+                tracker = self._trackers[key]
+
+        # Benign race: retry_count only feeds log strings
+        tracker.retry_count += 1
+
+        if now - tracker.first_event_time < tracker.next_log_time:
+            return False
 
         with self._lock:
-            if key not in self._trackers:
-                # First attempt - always log
-                first_interval = self.intervals[0] if self.intervals else 2
-                self._trackers[key] = {
-                    'first_event_time': now,
-                    'next_log_time': first_interval,  # Absolute time from first event
-                    'prev_log_time': 0,  # Track previous log time for milestone calculation
-                    'interval_index': 0,
-                    'retry_count': 1
-                }
-                return True
-
-            tracker = self._trackers[key]
-            tracker['retry_count'] += 1
-
-            elapsed = now - tracker['first_event_time']
-
-            if elapsed >= tracker['next_log_time']:
-                # Time to log - compute next log time
-                tracker['prev_log_time'] = tracker['next_log_time']
-                tracker['interval_index'] += 1
-
-                # Get next interval (use last value if we've exceeded the list)
-                idx = min(tracker['interval_index'], len(self.intervals) - 1)
-                next_interval = self.intervals[idx]
-
-                tracker['next_log_time'] = self._compute_next_log_time(
-                    tracker['prev_log_time'], next_interval
-                )
-                return True
+            # Re-check under the lock: another thread may have advanced the milestone
+            if now - tracker.first_event_time < tracker.next_log_time:
+                return False
 
-            return False
+            # Time to log - advance to the next precomputed milestone
+            tracker.interval_index += 1
+            tracker.next_log_time = self._deadline(tracker.interval_index)
+            return True
 
     def get_retry_count(self, key: str) -> int:
         """Get the current retry count for a key."""
-        with self._lock:
-            if key in self._trackers:
-                return self._trackers[key]['retry_count']
-            return 0
+        tracker = self._trackers.get(key)  # Read-only: no lock needed
+        return tracker.retry_count if tracker is not None else 0
 
     def reset(self, key: str):
         """
@@ -119,8 +141,7 @@ class SmartRetryLogger:
             key: The retry context key to reset.
         """
         with self._lock:
-            if key in self._trackers:
-                del self._trackers[key]
+            self._trackers.pop(key, None)
 
     def _format_duration(self, seconds: float) -> str:
         """Format a duration in seconds to a human-readable string."""
@@ -139,18 +160,39 @@ class SmartRetryLogger:
 
         Returns a string like "(retry #5)" or "(retry #100, next log at ~10m)"
         """
-        with self._lock:
-            if key not in self._trackers:
-                return ""
+        # Read-only: a concurrent milestone advance only changes which
+        # consistent value is shown, so no lock is taken
+        tracker = self._trackers.get(key)
+        if tracker is None:
+            return ""
 
-            tracker = self._trackers[key]
-            count = tracker['retry_count']
-            next_log = tracker['next_log_time']
+        count = tracker.retry_count
+        next_log = tracker.next_log_time
 
-            if tracker['interval_index'] > 0:
-                return f"(retry #{count}, next log at ~{self._format_duration(next_log)})"
-            else:
-                return f"(retry #{count})"
+        if tracker.interval_index > 0:
+            return f"(retry #{count}, next log at ~{self._format_duration(next_log)})"
+        else:
+            return f"(retry #{count})"
+
+    def check_and_format(self, key: str, log: logging.Logger,
+                         level: int = logging.INFO) -> Optional[str]:
+        """
+        Combined should_log() + format_retry_info() for the common call pattern.
+
+        Args:
+            key: The retry context key.
+            log: Logger the message will go to.
+            level: Level the message will be logged at.
+
+        Returns:
+            The retry info string if a message should be logged now, else None.
+            Returns None without touching the tracker when the level is disabled.
+        """
+        if not log.isEnabledFor(level):
+            return None
+        if not self.should_log(key):
+            return None
+        return self.format_retry_info(key)
 
 
 # Global smart retry logger instance